@@ -6,6 +6,7 @@ Simulates GitHub Actions workflows locally
 
 import sys
 import subprocess
+import importlib.util
 from pathlib import Path
 
 
@@ -46,6 +47,26 @@ def run_command(cmd, check_name):
         return False
 
 
+def start_command(cmd):
+    """Start a command without waiting for it; output is captured so parallel runs don't interleave."""
+    print(f"Running: {' '.join(cmd)}")
+    try:
+        return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    except Exception as e:
+        print(f"{Colors.RED}Error running {cmd[0]}: {e}{Colors.NC}\n")
+        return None
+
+
+def wait_command(process, check_name):
+    """Wait for a command from start_command, print its output and check its return code."""
+    if process is None:
+        return print_status(1, check_name)
+    output, _ = process.communicate()
+    if output:
+        print(output if output.endswith("\n") else output + "\n", end="")
+    return print_status(process.returncode, check_name)
+
+
 def main():
     """Main CI/CD test runner."""
     print_header("Local CI/CD Test Suite")
@@ -84,40 +105,36 @@ def main():
     ):
         print(f"{Colors.YELLOW}Warning: Testing tools may not be installed{Colors.NC}")
 
-    # 1. Linting
-    print_header("Linting")
+    # 1. Linting and 2. Code Formatting are independent, so run them concurrently
+    print_header("Linting & Code Formatting Checks")
 
-    print("1️⃣ Linting with flake8...")
-    if not run_command(
-        ["flake8", "ml_cli", "--count", "--select=E9,F63,F7,F82", "--show-source", "--statistics"],
-        "flake8 linting (critical errors)"
-    ):
-        all_passed = False
+    print("1️⃣ Linting with flake8 and 2️⃣ checking code formatting with Black...")
+    flake8_critical = start_command(
+        ["flake8", "ml_cli", "--count", "--select=E9,F63,F7,F82", "--show-source", "--statistics"]
+    )
+    flake8_style = start_command(
+        ["flake8", "ml_cli", "--count", "--exit-zero", "--max-complexity=10", "--max-line-length=127", "--statistics"]
+    )
+    black_check = start_command(["black", "--check", "ml_cli", "tests", "--line-length=127"])
 
-    if not run_command(
-        ["flake8", "ml_cli", "--count", "--exit-zero", "--max-complexity=10", "--max-line-length=127", "--statistics"],
-        "flake8 linting (style checks)"
-    ):
+    if not wait_command(flake8_critical, "flake8 linting (critical errors)"):
         all_passed = False
 
-    # 2. Code Formatting
-    print_header("Code Formatting Checks")
+    if not wait_command(flake8_style, "flake8 linting (style checks)"):
+        all_passed = False
 
-    print("2️⃣ Checking code formatting with Black...")
-    if not run_command(
-        ["black", "--check", "ml_cli", "tests", "--line-length=127"],
-        "Black formatting"
-    ):
+    if not wait_command(black_check, "Black formatting"):
         print(f"{Colors.YELLOW}💡 Tip: Run 'black ml_cli tests --line-length=127' to fix formatting.{Colors.NC}\n")
         all_passed = False
 
     # 3. Unit Tests
     print_header("Running Unit Tests")
 
-    if not run_command(
-        [sys.executable, "-m", "pytest", "tests/", "-v", "--cov=ml_cli", "--cov-report=xml"],
-        "Unit tests with coverage"
-    ):
+    pytest_cmd = [sys.executable, "-m", "pytest", "tests/", "-v", "--cov=ml_cli", "--cov-report=xml"]
+    if importlib.util.find_spec("xdist") is not None:
+        pytest_cmd += ["-n", "auto"]  # spread tests across cores when pytest-xdist is installed
+
+    if not run_command(pytest_cmd, "Unit tests with coverage"):
         all_passed = False
 
     # Final Summary
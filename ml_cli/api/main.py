@@ -1,31 +1,349 @@
 import os
+import time
+import asyncio
+import queue
 import logging
+import threading
+import itertools
+import multiprocessing
+import numpy as np
 import pandas as pd
 import joblib
+import orjson
+from dataclasses import dataclass
 from pathlib import Path
-from fastapi import FastAPI, HTTPException, Body
+from typing import Any, List, Optional
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from fastapi import FastAPI, HTTPException, Body, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.openapi.utils import get_openapi
-from ml_cli.utils.utils import load_model, get_config_output_dir, format_prediction_response, convert_numpy_types
+from fastapi.routing import APIRoute
+from pydantic import TypeAdapter, ValidationError
+from ml_cli.utils.utils import (
+    load_model,
+    get_config_output_dir,
+    format_prediction_response,
+    format_batch_prediction_response,
+    numeric_feature_names,
+)
 from ml_cli.core.predict import make_predictions
 
+
+def _json_bytes(content) -> bytes:
+    """Serialize with orjson; numpy arrays and scalars are handled natively."""
+    return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (numpy arrays and scalars are serialized natively)."""
+
+    def render(self, content) -> bytes:
+        return _json_bytes(content)
+
+
+class ORJSONRequest(Request):
+    """Request whose JSON body is parsed with orjson instead of the stdlib json module."""
+
+    async def json(self):
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """Route that hands endpoints an ORJSONRequest (orjson's decode error subclasses json's, so bad bodies still 422)."""
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            return await handler(ORJSONRequest(request.scope, request.receive))
+
+        return route_handler
+
+
 # Create the FastAPI app
-app = FastAPI(title="ML-CLI API", description="API for ML model predictions with dynamic examples", version="1.0.0")
+app = FastAPI(
+    title="ML-CLI API",
+    description="API for ML model predictions with dynamic examples",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
+app.router.route_class = ORJSONRoute  # must be set before the routes below are declared
 
 # Global variables for this module
-pipeline = None
-feature_info = None
-PredictionPayload = None
-sample_input_for_docs = None
-encoders = None  # NEW: Store categorical encoders
+_batcher = None  # _MicroBatcher when ML_CLI_BATCH_WINDOW_MS > 0
+MAX_MICRO_BATCH = 64
+STREAM_CHUNK_ROWS = 1024  # rows predicted per NDJSON chunk of /predict/batch?stream=true
+_worker_pipeline = None  # the model as loaded inside a prediction worker process
+MODEL_ARTIFACTS = ("lightautoml_model.pkl", "feature_info.json", "encoders.pkl")
+
+
+@dataclass(frozen=True)
+class _ModelState:
+    """Everything loaded for one model, swapped in as a whole by _load_model_artifacts.
+
+    Endpoints read ``_state`` once per request and use only that snapshot, so a
+    concurrent /reload-model never mixes the old model with the new feature set.
+    """
+
+    pipeline: Any
+    feature_info: dict
+    payload_model: Any  # the PredictionPayload pydantic model for these features
+    samples_adapter: Optional[TypeAdapter]  # validates a list of payloads in one call, for /predict/batch
+    sample_input: Optional[dict]
+    encoder_maps: dict  # feature -> {class: code}, the LabelEncoders as plain dict lookups
+    encoder_valid_values: dict  # feature -> its classes rendered once for "Valid values" errors
+    feature_names: tuple  # feature_names in model input order
+    feature_set: frozenset  # the same names, for the missing-feature check
+    numeric_features: tuple  # features with an int/float field type
+    task_type: str  # feature_info task_type, lower-cased once at load
+    use_ndarray: bool  # all-numeric features and the model accepts a plain 2D array (see _accepts_ndarray)
+    static_bodies: dict  # route path -> JSON body pre-rendered at load (see _render_static_bodies)
+    fingerprint: tuple  # (mtime_ns, size) of each model artifact when loaded
+    predict_pool: Optional[ProcessPoolExecutor] = None  # worker processes holding this model
+
+
+_state: Optional[_ModelState] = None  # None until a model has been loaded
+
+
+def _artifacts_fingerprint(output_dir: str) -> tuple:
+    """Return the (mtime_ns, size) of every model artifact, None for missing ones."""
+    fingerprint = []
+    for name in MODEL_ARTIFACTS:
+        try:
+            st = os.stat(os.path.join(output_dir, name))
+            fingerprint.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            fingerprint.append(None)
+    return tuple(fingerprint)
+
+
+# Single worker: model loads (startup and /reload-model) never run concurrently
+_model_loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-loader")
+
+
+def _worker_init(output_dir: str):
+    """Load the model once in each prediction worker process."""
+    global _worker_pipeline
+    _worker_pipeline = load_model(output_dir)[0]
+
+
+def _worker_predict(input_data, task_type: str, return_probabilities: bool):
+    predictions_array, _, probabilities = make_predictions(
+        _worker_pipeline, input_data, task_type, return_probabilities, return_dataframe=False
+    )
+    return predictions_array, probabilities
+
+
+def _start_predict_pool(output_dir: str) -> Optional[ProcessPoolExecutor]:
+    """Start prediction worker processes holding the model in output_dir.
+
+    Only used when ML_CLI_PREDICT_PROCESSES > 0: worth it for GIL-bound
+    pipelines whose predict cost dwarfs pickling the input to a worker.
+    """
+    processes = int(os.getenv("ML_CLI_PREDICT_PROCESSES", "0"))
+    if processes <= 0:
+        return None
+
+    pool = ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=multiprocessing.get_context("spawn"),  # don't fork a threaded server
+        initializer=_worker_init,
+        initargs=(output_dir,),
+    )
+    logging.info(f"Serving predictions from {processes} worker process(es)")
+    return pool
+
+
+def _run_model(state: _ModelState, input_data, return_probabilities: bool = True):
+    """Predict with the state's model: in a worker process when it has a pool, else in this thread."""
+    if state.predict_pool is not None:
+        return state.predict_pool.submit(_worker_predict, input_data, state.task_type, return_probabilities).result()
+    predictions_array, _, probabilities = make_predictions(
+        state.pipeline, input_data, state.task_type, return_probabilities, return_dataframe=False
+    )
+    return predictions_array, probabilities
+
+
+async def _run_model_async(state: _ModelState, input_data, return_probabilities: bool = True):
+    """_run_model for async endpoints: awaits the process pool directly, else offloads to the threadpool."""
+    if state.predict_pool is not None:
+        future = state.predict_pool.submit(_worker_predict, input_data, state.task_type, return_probabilities)
+        return await asyncio.wrap_future(future)
+    return await run_in_threadpool(_run_model, state, input_data, return_probabilities)
+
+
+class _MicroBatcher:
+    """Coalesce concurrent single-sample predictions into one model call.
+
+    The first queued request opens a window of ``window`` seconds; everything
+    queued before it closes (up to MAX_MICRO_BATCH rows) is stacked, predicted
+    in one make_predictions call, and each caller gets its own row back.
+    """
+
+    _STOP = object()  # queue sentinel that ends the worker thread
+
+    def __init__(self, window: float):
+        self.window = window
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="predict-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, state: _ModelState, input_data) -> Future:
+        """Queue one model input (1-row array or DataFrame); resolves to (predictions, probabilities)."""
+        future = Future()
+        self._queue.put((state, input_data, future))
+        return future
+
+    def stop(self):
+        """Predict what is already queued, then end the worker thread."""
+        self._queue.put(self._STOP)
+        self._thread.join()
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.window
+            while len(batch) < MAX_MICRO_BATCH:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            # Only inputs for the same model load and of the same kind are stacked: arrays and
+            # DataFrames (payloads that missed the fast path) can't be combined, and a reload
+            # during the window must not send earlier requests to the new model
+            groups = {}
+            for state, input_data, future in batch:
+                key = (id(state), isinstance(input_data, np.ndarray))
+                groups.setdefault(key, (state, []))[1].append((input_data, future))
+            for state, group in groups.values():
+                self._predict(state, group)
+
+    @staticmethod
+    def _predict(state: _ModelState, group):
+        try:
+            if isinstance(group[0][0], np.ndarray):
+                stacked = np.vstack([input_data for input_data, _ in group])
+            else:
+                stacked = pd.concat([input_data for input_data, _ in group], ignore_index=True)
+            predictions_array, probabilities = _run_model(state, stacked)
+        except Exception as e:
+            if len(group) == 1:
+                group[0][1].set_exception(e)
+                return
+            # One bad input must not fail every request that shared its window
+            logging.warning(f"Micro-batch prediction failed ({e}); predicting its {len(group)} requests one by one")
+            for input_data, future in group:
+                try:
+                    future.set_result(_run_model(state, input_data))
+                except Exception as e:
+                    future.set_exception(e)
+            return
+
+        for i, (_, future) in enumerate(group):
+            future.set_result(
+                (predictions_array[i : i + 1], probabilities[i : i + 1] if probabilities is not None else None)
+            )
 
 
 @app.on_event("startup")
 def startup_event():
-    """Load model on startup"""
-    global pipeline, feature_info, PredictionPayload, sample_input_for_docs, encoders
+    """Start loading the model in the background so health probes are answered immediately"""
+    global _batcher
+
+    app.state.model_future = _model_loader.submit(_load_model_at_startup)
+
+    batch_window_ms = float(os.getenv("ML_CLI_BATCH_WINDOW_MS", "0"))
+    if batch_window_ms > 0 and _batcher is None:
+        _batcher = _MicroBatcher(batch_window_ms / 1000)
+        logging.info(f"Micro-batching /predict requests with a {batch_window_ms}ms window")
+
+
+@app.on_event("shutdown")
+def shutdown_event():
+    global _batcher
+
+    if _batcher is not None:
+        _batcher.stop()
+        _batcher = None
+
+    state = _state
+    if state is not None and state.predict_pool is not None:
+        state.predict_pool.shutdown()
+
+
+def _model_loading() -> bool:
+    """True while a background model load is still in progress."""
+    future = getattr(app.state, "model_future", None)
+    return future is not None and not future.done()
+
+
+def _wait_for_model():
+    """Block until the current background model load has finished."""
+    future = getattr(app.state, "model_future", None)
+    if future is not None:
+        future.result()
+
+
+async def _model_loaded():
+    """Await the current background model load without tying up a threadpool thread."""
+    future = getattr(app.state, "model_future", None)
+    if future is not None:
+        await asyncio.wrap_future(future)
+
+
+def _current_state() -> _ModelState:
+    """The loaded model state, or a 503 while there is none."""
+    state = _state
+    if state is None:
+        raise HTTPException(status_code=503, detail="Model not loaded")
+    return state
+
 
-    config_path = os.getenv("ML_CLI_CONFIG", "config.yaml")
-    output_dir = get_config_output_dir(config_path)
+class _NoModelError(FileNotFoundError):
+    """No trained model in the output directory yet (an expected state, not a load failure)."""
+
+
+def _load_model_at_startup():
+    """Startup load: the API still starts (and answers 503) when no model can be loaded."""
+    try:
+        _load_model_artifacts()
+    except Exception:
+        pass  # already logged; /reload-model can load the model once it is trained
+
+
+def _load_model_artifacts(force: bool = False) -> bool:
+    """Load the model artifacts and swap them in as the new _state.
+
+    Returns False when the load was skipped because the artifacts on disk are
+    unchanged since the last successful load (pass force=True to always reload).
+    Raises when the model cannot be loaded; the previously loaded model (if any)
+    then stays in service.
+    """
+    global _state
+
+    # `ml serve` has already resolved the output directory; only parse the config when run standalone
+    output_dir = os.getenv("ML_CLI_OUTPUT_DIR") or get_config_output_dir(os.getenv("ML_CLI_CONFIG", "config.yaml"))
+
+    current = _state
+    fingerprint = _artifacts_fingerprint(output_dir)
+    if not force and current is not None and fingerprint == current.fingerprint:
+        logging.info("Model artifacts unchanged since last load - skipping reload")
+        return False
 
     try:
         # Load model using utils function
@@ -36,59 +354,186 @@ def startup_event():
             logging.warning("⚠️  No trained model found!")
             logging.warning(f"   Please run 'ml train' first to train a model.")
             logging.warning(f"   The API will start but predictions will not work until a model is available.")
-            pipeline = None
-            feature_info = None
-            PredictionPayload = None
-            sample_input_for_docs = None
-            encoders = None
-            return
+            raise _NoModelError(f"No trained model found in {output_dir}")
         
         loaded_pipeline, loaded_feature_info, loaded_payload_model, loaded_sample_input = result
 
-        # Set globals in this module
-        pipeline = loaded_pipeline
-        feature_info = loaded_feature_info
-        PredictionPayload = loaded_payload_model
-        sample_input_for_docs = loaded_sample_input
-
         # Load encoders if they exist (NEW)
+        loaded_encoders = None
         encoders_path = Path(output_dir) / "encoders.pkl"
         if encoders_path.exists():
-            encoders = joblib.load(encoders_path)
-            logging.info(f"✅ Loaded encoders for {len(encoders)} categorical features: {list(encoders.keys())}")
-            
+            loaded_encoders = joblib.load(encoders_path)
+            logging.info(
+                f"✅ Loaded encoders for {len(loaded_encoders)} categorical features: {list(loaded_encoders.keys())}"
+            )
+
             # Update sample input with categorical values
-            if sample_input_for_docs and feature_info and 'categorical_features' in feature_info:
-                categorical_features = feature_info['categorical_features']
-                for feature_name, encoder in encoders.items():
-                    if feature_name in sample_input_for_docs and len(encoder.classes_) > 0:
+            if loaded_sample_input and 'categorical_features' in loaded_feature_info:
+                for feature_name, encoder in loaded_encoders.items():
+                    if feature_name in loaded_sample_input and len(encoder.classes_) > 0:
                         # Use first category as example
-                        sample_input_for_docs[feature_name] = encoder.classes_[0]
+                        loaded_sample_input[feature_name] = encoder.classes_[0]
                 logging.info(f"📝 Updated sample input with categorical values")
         else:
-            encoders = None
             logging.info("ℹ️  No encoders file found - model expects numeric input for all features")
 
-        logging.info("✅ Model startup completed successfully")
-
+        feature_names_tuple = tuple(loaded_feature_info.get("feature_names", []))
+        numeric_features = numeric_feature_names(loaded_feature_info)
+        # LabelEncoder codes are positions in the sorted classes_, so a dict lookup matches transform()
+        encoder_maps = {
+            name: {cls: code for code, cls in enumerate(encoder.classes_.tolist())}
+            for name, encoder in (loaded_encoders or {}).items()
+        }
+        state = _ModelState(
+            pipeline=loaded_pipeline,
+            feature_info=loaded_feature_info,
+            payload_model=loaded_payload_model,
+            samples_adapter=TypeAdapter(List[loaded_payload_model]) if loaded_payload_model is not None else None,
+            sample_input=loaded_sample_input,
+            encoder_maps=encoder_maps,
+            encoder_valid_values={name: str(list(codes)) for name, codes in encoder_maps.items()},
+            feature_names=feature_names_tuple,
+            feature_set=frozenset(feature_names_tuple),
+            numeric_features=numeric_features,
+            task_type=loaded_feature_info.get("task_type", "classification").lower(),
+            # Arrays only help when every feature is numeric; otherwise the fast path always falls back
+            use_ndarray=_accepts_ndarray(loaded_pipeline) and len(numeric_features) == len(feature_names_tuple),
+            static_bodies=_render_static_bodies(loaded_feature_info, loaded_sample_input),
+            fingerprint=fingerprint,
+            predict_pool=_start_predict_pool(output_dir),
+        )
+
+    except _NoModelError:
+        raise  # not an error: the warnings above are all that gets logged
     except Exception as e:
         logging.error(f"❌ Error during model startup: {e}")
         import traceback
         logging.error(traceback.format_exc())
-        # Don't fail startup, but log the error
-        pipeline = None
-        feature_info = None
-        PredictionPayload = None
-        sample_input_for_docs = None
-        encoders = None
+        if current is not None:
+            logging.warning("Keeping the previously loaded model")
+        raise
+
+    # One assignment swaps everything in: requests keep using the previous model until here.
+    # The previous worker pool is not shut down explicitly: requests that read the old state
+    # may still submit to it, and it winds down by itself once the last of them drops it.
+    _state = state
+    logging.info("✅ Model startup completed successfully")
+    _refresh_openapi_schema()
+    return True
 
 
-def apply_categorical_encoding(payload: dict, encoders: dict) -> dict:
+def _model_info(info: dict) -> dict:
+    task_type = info.get("task_type", "unknown")
+
+    model_info = {
+        "model_type": task_type,
+        "feature_count": len(info.get("feature_names", [])),
+        "feature_names": info.get("feature_names", []),
+        "model_score": info.get("model_score"),
+    }
+
+    # Only add target_column for supervised tasks
+    if task_type.lower() in ["classification", "regression"]:
+        model_info["target_column"] = info.get("target_column")
+
+    return model_info
+
+
+def _render_static_bodies(info: dict, sample_input) -> dict:
+    """Serialize the responses that only change when the model is reloaded, once per load."""
+    bodies = {"/model-info": _json_bytes(_model_info(info))}
+    if sample_input is not None:
+        bodies["/predict/example"] = _json_bytes(sample_input)
+        bodies["/predict/batch"] = _json_bytes({"examples": [sample_input, sample_input]})
+    return bodies
+
+
+def _static_response(path: str) -> Response:
+    state = _state
+    body = state.static_bodies.get(path) if state is not None else None
+    if body is None:
+        raise HTTPException(status_code=503, detail="Model not loaded")
+    return Response(content=body, media_type="application/json")
+
+
+def _refresh_openapi_schema():
+    """Rebuild the cached OpenAPI schema so /docs shows the current example."""
+    app.openapi_schema = None
+    app.openapi()
+
+
+def _accepts_ndarray(model) -> bool:
+    """Whether the model can be fed a plain 2D array in feature_names order.
+
+    Only scikit-learn estimators fitted without column names qualify; LightAutoML
+    presets and estimators fitted on DataFrames look features up by name.
+    """
+    return hasattr(model, "get_params") and not hasattr(model, "feature_names_in_")
+
+
+def _payload_to_row(payload: dict, feature_names: tuple):
+    """Build a (1, n_features) float64 array from the payload, or None if a value is not numeric."""
+    try:
+        row = np.fromiter((payload[name] for name in feature_names), dtype=np.float64, count=len(feature_names))
+    except (TypeError, ValueError):
+        return None
+    return row.reshape(1, -1)
+
+
+def _samples_to_array(samples: list, feature_names: tuple):
+    """Build a (n_samples, n_features) float64 array in one allocation, or None if a value is not numeric."""
+    n_features = len(feature_names)
+    try:
+        values = np.fromiter(
+            (sample[name] for sample in samples for name in feature_names),
+            dtype=np.float64,
+            count=len(samples) * n_features,
+        )
+    except (TypeError, ValueError):
+        return None
+    return values.reshape(len(samples), n_features)
+
+
+def _null_numeric_to_nan(input_df: pd.DataFrame, numeric_features: tuple) -> pd.DataFrame:
+    """Give the numeric columns that nulls left as object a float dtype (the nulls become NaN)."""
+    dtypes = input_df.dtypes
+    columns = [name for name in numeric_features if dtypes[name] == object]
+    if columns:
+        input_df[columns] = input_df[columns].astype(np.float64)
+    return input_df
+
+
+def _ndjson_chunks(state: _ModelState, input_data, samples: list, include_proba: bool):
+    """Predict STREAM_CHUNK_ROWS rows at a time, yielding each chunk's results as NDJSON lines.
+
+    Every chunk uses the model of the given state, even if a reload lands mid-stream.
+    """
+    for start in range(0, len(samples), STREAM_CHUNK_ROWS):
+        stop = start + STREAM_CHUNK_ROWS
+        chunk = input_data[start:stop] if isinstance(input_data, np.ndarray) else input_data.iloc[start:stop]
+        predictions_array, probabilities = _run_model(state, chunk, include_proba)
+        results = format_batch_prediction_response(
+            predictions_array, state.feature_info, probabilities, task_type=state.task_type
+        )
+
+        lines = []
+        for i, (result, sample) in enumerate(zip(results, samples[start:stop]), start):
+            result["input_features"] = sample
+            result["sample_index"] = i
+            lines.append(_json_bytes(result))
+        lines.append(b"")
+        yield b"\n".join(lines)
+
+
+def apply_categorical_encoding(payload: dict, encoder_maps: dict, valid_values: Optional[dict] = None) -> dict:
     """Apply categorical encoding to payload using saved encoders.
+
+    The payload is encoded in place (/predict passes its own copy) and returned.
     
     Args:
         payload: Dictionary with feature names and values
-        encoders: Dictionary of LabelEncoders for categorical features
+        encoder_maps: {feature: {class: code}} built from the LabelEncoders at model load
+        valid_values: {feature: rendered classes} for the error message (optional)
         
     Returns:
         Encoded payload dictionary
@@ -96,87 +541,76 @@ def apply_categorical_encoding(payload: dict, encoders: dict) -> dict:
     Raises:
         HTTPException: If unknown categorical value is encountered
     """
-    if not encoders:
+    if not encoder_maps:
         return payload  # No encoding needed
     
-    encoded_payload = payload.copy()
-    
-    for feature_name, encoder in encoders.items():
-        if feature_name in encoded_payload:
-            original_value = encoded_payload[feature_name]
+    for feature_name, codes in encoder_maps.items():
+        if feature_name in payload:
+            original_value = payload[feature_name]
             
             # Check if value is in encoder's known classes
-            if original_value not in encoder.classes_:
-                valid_values = list(encoder.classes_)
+            code = codes.get(original_value)
+            if code is None:
                 raise HTTPException(
                     status_code=400,
                     detail=f"Unknown value '{original_value}' for feature '{feature_name}'. "
-                           f"Valid values are: {valid_values}"
+                           f"Valid values are: {(valid_values or {}).get(feature_name) or list(codes)}"
                 )
             
             # Encode the value
-            encoded_payload[feature_name] = int(encoder.transform([original_value])[0])
-            logging.debug(f"Encoded {feature_name}: '{original_value}' -> {encoded_payload[feature_name]}")
+            payload[feature_name] = code
+            logging.debug(f"Encoded {feature_name}: '{original_value}' -> {code}")
     
-    return encoded_payload
+    return payload
 
 
 @app.get("/")
-def root():
+async def root():
     """Welcome message and API status"""
     return {
         "message": "Welcome to the ML-CLI API!",
         "docs": "/docs",
         "health": "/health",
         "model_info": "/model-info",
-        "status": ("operational" if pipeline is not None else "model_not_loaded"),
+        "status": ("operational" if _state is not None else "model_not_loaded"),
         "name": "ML-CLI API",
     }
 
 
 @app.get("/health")
-def health_check():
-    return {"status": "healthy", "model_loaded": pipeline is not None}
+async def health_check():
+    loading = _model_loading()
+    model_loaded = not loading and _state is not None
+    return ORJSONResponse({"status": "healthy", "model_loaded": model_loaded, "model_loading": loading})
 
 
 @app.get("/model-info")
-def get_model_info():
-    if pipeline is None or feature_info is None:
-        raise HTTPException(status_code=503, detail="Model not loaded")
-
-    task_type = feature_info.get("task_type", "unknown")
-
-    info = {
-        "model_type": task_type,
-        "feature_count": len(feature_info.get("feature_names", [])),
-        "feature_names": feature_info.get("feature_names", []),
-        "model_score": feature_info.get("model_score"),
-    }
-
-    # Only add target_column for supervised tasks
-    if task_type.lower() in ["classification", "regression"]:
-        info["target_column"] = feature_info.get("target_column")
-
-    return info
+async def get_model_info():
+    await _model_loaded()
+    return _static_response("/model-info")
 
 
 @app.get("/predict/example")
-def get_prediction_example():
-    if sample_input_for_docs is None:
-        raise HTTPException(status_code=503, detail="Model not loaded")
-    return sample_input_for_docs
+async def get_prediction_example():
+    await _model_loaded()
+    return _static_response("/predict/example")
 
 
 @app.post("/predict")
-def predict(payload: dict = Body(...)):
-    if pipeline is None or feature_info is None:
-        raise HTTPException(status_code=503, detail="Model not loaded")
+async def predict(payload: dict = Body(...), include_proba: bool = True):
+    """Make a prediction for one sample; pass include_proba=false to skip class probabilities"""
+    await _model_loaded()
+    state = _current_state()  # one snapshot for the whole request, even if the model is reloaded meanwhile
 
     try:
+        # Encoding and validation rewrite the values in place; the response echoes them as sent
+        input_features = payload
+        payload = dict(payload)
+
         # Apply categorical encoding if encoders are available (NEW)
-        if encoders:
+        if state.encoder_maps:
             try:
-                payload = apply_categorical_encoding(payload, encoders)
+                payload = apply_categorical_encoding(payload, state.encoder_maps, state.encoder_valid_values)
                 logging.info("Applied categorical encoding to input payload")
             except HTTPException:
                 raise  # Re-raise validation errors
@@ -184,56 +618,62 @@ def predict(payload: dict = Body(...)):
                 logging.error(f"Error applying categorical encoding: {e}")
                 raise HTTPException(status_code=400, detail=f"Encoding error: {str(e)}")
         
-        # Validate payload has all required features
-        feature_names = feature_info.get("feature_names", [])
-        missing_features = [f for f in feature_names if f not in payload]
-        # Fixed: avoid ambiguous array truth value
-        if len(missing_features) > 0:
+        # Validate payload has all required features (one set comparison; list them only on failure)
+        if not payload.keys() >= state.feature_set:
+            missing_features = [f for f in state.feature_names if f not in payload]
             raise HTTPException(status_code=400, detail=f"Missing required features: {missing_features}")
 
-        # Create DataFrame from payload with explicit dtype handling
-        try:
-            input_df = pd.DataFrame([payload])
-
-            # Ensure columns are in the right order and handle missing
-            # columns gracefully
-            for col in feature_names:
-                if col not in input_df.columns:
-                    raise HTTPException(status_code=400, detail=f"Missing feature: {col}")
-
-            input_df = input_df[feature_names]
+        # Coerce values to the trained feature types (encoded categoricals are ints by now).
+        # The generated model has plain fields only (no aliases or computed fields), so its
+        # __dict__ already holds the validated values and model_dump()'s copy is unnecessary.
+        if state.payload_model is not None:
+            try:
+                payload.update(state.payload_model.model_validate(payload).__dict__)
+            except ValidationError as e:
+                raise HTTPException(status_code=400, detail=e.errors(include_url=False, include_context=False))
 
-            # Convert to numeric where possible to avoid type issues
-            for col in input_df.columns:
-                try:
-                    input_df[col] = pd.to_numeric(input_df[col], errors="ignore")
-                except Exception:
-                    pass  # Keep original type if conversion fails
+        # Fast path: skip the one-row DataFrame when the model takes a plain array
+        input_data = _payload_to_row(payload, state.feature_names) if state.use_ndarray else None
 
-        except Exception as e:
-            raise HTTPException(status_code=400, detail=f"Error creating input DataFrame: {str(e)}")
+        # Create DataFrame from payload with explicit dtype handling
+        if input_data is None:
+            try:
+                # One row of values in model column order (missing features were rejected above);
+                # skips the key inference pandas does for a list of dicts. Values were already
+                # coerced to their feature types; only nulls still need a numeric column.
+                row = [payload[name] for name in state.feature_names]
+                input_df = pd.DataFrame([row], columns=state.feature_names)
+            except Exception as e:
+                raise HTTPException(status_code=400, detail=f"Error creating input DataFrame: {str(e)}")
+            input_data = _null_numeric_to_nan(input_df, state.numeric_features) if None in row else input_df
 
         # Make prediction using the proper core function
         try:
-            task_type = feature_info.get("task_type", "classification").lower()
-            predictions_array, _, probabilities = make_predictions(pipeline, input_df, task_type)
-            # Convert to native Python types
-            prediction = convert_numpy_types(predictions_array)
+            if _batcher is not None:
+                predictions_array, probabilities = await asyncio.wrap_future(_batcher.submit(state, input_data))
+                if not include_proba:
+                    probabilities = None
+            else:
+                predictions_array, probabilities = await _run_model_async(state, input_data, include_proba)
             if probabilities is not None:
                 # Get the probabilities for the first (and only) sample
-                probabilities = convert_numpy_types(probabilities[0])
+                probabilities = probabilities[0]
         except Exception as e:
             logging.error(f"Pipeline prediction error: {e}")
             raise HTTPException(status_code=500, detail=f"Model prediction failed: {str(e)}")
 
         # Format response based on task type
-        result = format_prediction_response(prediction, feature_info, probabilities)
+        # (it converts the numpy values to native Python types itself)
+        result = format_prediction_response(
+            predictions_array, state.feature_info, probabilities, task_type=state.task_type
+        )
 
-        # Add input features for reference (convert any numpy types)
-        result["input_features"] = convert_numpy_types(payload)
+        # Add input features for reference (the request's own values, as /predict/batch does)
+        result["input_features"] = input_features
 
-        # Final conversion to ensure everything is JSON-serializable
-        return convert_numpy_types(result)
+        # Returned as a Response so FastAPI skips its jsonable_encoder walk; anything
+        # numpy left in the result is serialized natively by orjson in the same pass
+        return ORJSONResponse(result)
 
     except HTTPException:
         raise  # Re-raise HTTP exceptions
@@ -243,19 +683,21 @@ def predict(payload: dict = Body(...)):
 
 
 @app.get("/predict/batch", summary="Get batch prediction example")
-def get_batch_prediction_example():
+async def get_batch_prediction_example():
     """Get an example of batch prediction format"""
-    if sample_input_for_docs is None:
-        raise HTTPException(status_code=503, detail="Model not loaded")
-
-    return {"examples": [sample_input_for_docs, sample_input_for_docs]}  # You could modify this to show variation
+    await _model_loaded()
+    return _static_response("/predict/batch")
 
 
 @app.post("/predict/batch")
-def predict_batch(payload: dict = Body(...)):
-    """Make predictions on multiple samples"""
-    if pipeline is None or feature_info is None:
-        raise HTTPException(status_code=503, detail="Model not loaded")
+def predict_batch(payload: dict = Body(...), include_proba: bool = True, stream: bool = False):
+    """Make predictions on multiple samples; pass include_proba=false to skip class probabilities.
+
+    With stream=true the results are sent as NDJSON (one result object per line)
+    while later chunks are still being predicted.
+    """
+    _wait_for_model()
+    state = _current_state()  # one snapshot for the whole request, including every streamed chunk
 
     try:
         # Expect payload to have "samples" key with list of feature
@@ -269,71 +711,76 @@ def predict_batch(payload: dict = Body(...)):
         if not isinstance(samples, list) or len(samples) == 0:
             raise HTTPException(status_code=400, detail="'samples' must be a non-empty list")
 
-        # Apply categorical encoding to all samples (NEW)
-        if encoders:
-            try:
-                encoded_samples = []
-                for i, sample in enumerate(samples):
-                    encoded_sample = apply_categorical_encoding(sample, encoders)
-                    encoded_samples.append(encoded_sample)
-                samples = encoded_samples
-                logging.info(f"Applied categorical encoding to {len(samples)} samples")
-            except HTTPException:
-                raise  # Re-raise validation errors
-            except Exception as e:
-                logging.error(f"Error applying categorical encoding to batch: {e}")
-                raise HTTPException(status_code=400, detail=f"Encoding error: {str(e)}")
-
-        feature_names = feature_info.get("feature_names", [])
-
         # Validate all samples
         for i, sample in enumerate(samples):
-            missing_features = [f for f in feature_names if f not in sample]
-            # Fixed: avoid ambiguous array truth value
-            if len(missing_features) > 0:
+            if not sample.keys() >= state.feature_set:
+                missing_features = [f for f in state.feature_names if f not in sample]
                 raise HTTPException(status_code=400, detail=f"Sample {i} missing required features: " f"{missing_features}")
 
-        # Create DataFrame from all samples
-        try:
-            input_df = pd.DataFrame(samples)
-            input_df = input_df[feature_names]
+        # Encode each categorical feature with one lookup per sample, on copies: the raw samples are echoed back
+        rows = samples
+        if state.encoder_maps:
+            rows = [dict(sample) for sample in samples]
+            for feature_name, codes in state.encoder_maps.items():
+                if feature_name not in state.feature_set:
+                    continue
+                encoded = [codes.get(row[feature_name]) for row in rows]
+                if None in encoded:
+                    unknown = [i for i, code in enumerate(encoded) if code is None]
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Unknown value(s) for feature '{feature_name}' in samples {unknown}. "
+                        f"Valid values are: {state.encoder_valid_values.get(feature_name) or list(codes)}",
+                    )
+                for row, code in zip(rows, encoded):
+                    row[feature_name] = code
+
+        # Coerce values to the trained feature types, with the same rules as /predict
+        if state.samples_adapter is not None:
+            try:
+                rows = [sample_model.__dict__ for sample_model in state.samples_adapter.validate_python(rows)]
+            except ValidationError as e:
+                raise HTTPException(status_code=400, detail=e.errors(include_url=False, include_context=False))
 
-            # Convert to numeric where possible
-            for col in input_df.columns:
-                try:
-                    input_df[col] = pd.to_numeric(input_df[col], errors="ignore")
-                except Exception:
-                    pass
+        # Fast path: the whole batch as one float64 array when the model takes a plain array
+        input_data = _samples_to_array(rows, state.feature_names) if state.use_ndarray else None
 
-        except Exception as e:
-            raise HTTPException(status_code=400, detail=f"Error creating batch DataFrame: {str(e)}")
+        # Create DataFrame from all samples
+        if input_data is None:
+            try:
+                # Column lists straight from the rows (all keys checked above) skip the per-row dict probing
+                input_df = pd.DataFrame({name: [row[name] for row in rows] for name in state.feature_names})
+            except Exception as e:
+                raise HTTPException(status_code=400, detail=f"Error creating batch DataFrame: {str(e)}")
+            input_data = _null_numeric_to_nan(input_df, state.numeric_features)
+
+        if stream:
+            chunks = _ndjson_chunks(state, input_data, samples, include_proba)
+            # Predict the first chunk before responding so model errors still become a 500
+            try:
+                first_chunk = next(chunks)
+            except Exception as e:
+                logging.error(f"Batch prediction error: {e}")
+                raise HTTPException(status_code=500, detail=f"Batch prediction failed: {str(e)}")
+            return StreamingResponse(itertools.chain([first_chunk], chunks), media_type="application/x-ndjson")
 
         # Make predictions using the proper core function
         try:
-            task_type = feature_info.get("task_type", "classification").lower()
-            predictions_array, _, probabilities = make_predictions(pipeline, input_df, task_type)
-            # Convert to native Python types
-            predictions = convert_numpy_types(predictions_array)
-            if probabilities is not None:
-                probabilities = convert_numpy_types(probabilities)
+            predictions_array, probabilities = _run_model(state, input_data, include_proba)
         except Exception as e:
             logging.error(f"Batch prediction error: {e}")
             raise HTTPException(status_code=500, detail=f"Batch prediction failed: {str(e)}")
 
-        # Format results
-        results = []
-        for i, (sample, pred) in enumerate(zip(samples, predictions)):
-            prob = probabilities[i] if probabilities is not None else None
-            result = format_prediction_response([pred], feature_info, prob)
-            result["input_features"] = convert_numpy_types(sample)
+        # Format all rows in one pass over the native-converted arrays
+        results = format_batch_prediction_response(
+            predictions_array, state.feature_info, probabilities, task_type=state.task_type
+        )
+        for i, (result, sample) in enumerate(zip(results, samples)):
+            result["input_features"] = sample
             result["sample_index"] = i
-            results.append(convert_numpy_types(result))
 
-        return convert_numpy_types({
-            "predictions": results, 
-            "total_samples": len(samples), 
-            "task_type": task_type
-        })
+        # results are native already and samples came from the JSON body, so no conversion pass
+        return ORJSONResponse({"predictions": results, "total_samples": len(samples), "task_type": state.task_type})
 
     except HTTPException:
         raise  # Re-raise HTTP exceptions
@@ -342,6 +789,35 @@ def predict_batch(payload: dict = Body(...)):
         raise HTTPException(status_code=400, detail=f"Batch prediction error: {str(e)}")
 
 
+@app.post("/reload-model")
+async def reload_model(force: bool = False):
+    """Reload the model after retraining.
+
+    The reload is skipped when the model artifacts on disk are unchanged since
+    the last load; pass ``force=true`` to reload regardless. A failed reload
+    leaves the previously loaded model in service.
+    """
+    # The example is already pre-rendered per load; keep the old bytes to compare, not a digest
+    old_state = _state
+    old_example = old_state.static_bodies.get("/predict/example") if old_state is not None else None
+    # Not stored as app.state.model_future: requests keep using the current model
+    # instead of waiting for the reload to finish
+    try:
+        reloaded = await asyncio.wrap_future(_model_loader.submit(_load_model_artifacts, force))
+    except Exception as e:
+        if _state is None:
+            raise HTTPException(status_code=503, detail="Model could not be loaded. Please run 'ml train' first.")
+        raise HTTPException(status_code=500, detail=f"Model reload failed, still serving the previous model: {e}")
+
+    state = _state
+    return {
+        "status": "reloaded" if reloaded else "unchanged",
+        "model_loaded": True,
+        "feature_count": len(state.feature_names),
+        "example_updated": state.static_bodies.get("/predict/example") != old_example,
+    }
+
+
 def custom_openapi():
     if app.openapi_schema:
         return app.openapi_schema
@@ -354,6 +830,8 @@ def custom_openapi():
     )
 
     # Add example to the predict endpoint if we have sample input
+    state = _state
+    sample_input_for_docs = state.sample_input if state is not None else None
     if sample_input_for_docs:
         predict_path = openapi_schema["paths"].get("/predict")
         if predict_path and "post" in predict_path:
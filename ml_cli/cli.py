@@ -1,3 +1,5 @@
+import sys
+import importlib
 import warnings
 import rich_click as click
 import logging
@@ -11,35 +13,61 @@ logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
 )
 
-# Suppress the torch warning from TPOT before any imports
+# Suppress the torch warning from TPOT before any command modules are imported
 warnings.filterwarnings("ignore", message="Warning: optional dependency `torch` is not available.*")
 
-from ml_cli.commands.init import init  # noqa: E402
-from ml_cli.commands.eda import eda  # noqa: E402
-from ml_cli.commands.preprocess import preprocess  # noqa: E402
-from ml_cli.commands.clean import clean  # noqa: E402
-from ml_cli.commands.train import train  # noqa: E402
-from ml_cli.commands.predict import predict  # noqa: E402
-from ml_cli.commands.serve import serve  # noqa: E402
-from ml_cli.commands.completion import completion  # noqa: E402
+# Subcommand name -> (import path, short help). Modules are imported only when
+# the command runs, so `ml --help` does not pull in pandas, seaborn or sklearn.
+LAZY_COMMANDS = {
+    "init": ("ml_cli.commands.init.init", "Initialize a new configuration file (YAML or JSON)."),
+    "eda": (
+        "ml_cli.commands.eda.eda",
+        "Perform exploratory data analysis (EDA) on the dataset specified in the configuration file.",
+    ),
+    "preprocess": ("ml_cli.commands.preprocess.preprocess", "Preprocess the dataset specified in the configuration file."),
+    "clean": ("ml_cli.commands.clean.clean", "Clean up all generated artifacts recorded in .artifacts.log."),
+    "train": ("ml_cli.commands.train.train", "Train the ML model based on the configuration file."),
+    "predict": ("ml_cli.commands.predict.predict", "Make predictions on new data using a trained model."),
+    "serve": ("ml_cli.commands.serve.serve", "Serve the ML model as a REST API using FastAPI."),
+    "completion": ("ml_cli.commands.completion.completion", "Show the shell completion setup instructions."),
+}
 
 
-@click.group()
+class LazyGroup(click.RichGroup):
+    """Click group that imports subcommand modules on first use."""
+
+    def __init__(self, *args, lazy_commands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+        self._formatting_help = False
+
+    def list_commands(self, ctx):
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.lazy_commands:
+            return super().get_command(ctx, cmd_name)
+
+        import_path, short_help = self.lazy_commands[cmd_name]
+        module_name, attr = import_path.rsplit(".", 1)
+        # The help listing only needs the name and summary; don't import for it
+        if self._formatting_help and module_name not in sys.modules:
+            return click.RichCommand(cmd_name, help=short_help, short_help=short_help)
+        return getattr(importlib.import_module(module_name), attr)
+
+    def format_help(self, ctx, formatter):
+        self._formatting_help = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._formatting_help = False
+
+
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
 def cli():
     """Main ML-CLI application entry point."""
     pass
 
 
-# Register the commands
-cli.add_command(init)
-
-cli.add_command(eda)
-cli.add_command(preprocess)
-cli.add_command(clean)
-cli.add_command(train)
-cli.add_command(predict)
-cli.add_command(serve)
-cli.add_command(completion)
-
 if __name__ == "__main__":
     cli()
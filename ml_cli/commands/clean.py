@@ -23,18 +23,22 @@ def clean():
     missing_artifacts = []
 
     with open(artifacts_log_path, "r") as file:
-        # Read each line, which should contain a path to an artifact
-        for line in file:
-            artifact_path = line.strip()
-            if os.path.isfile(artifact_path):
-                # Delete the artifact
-                os.remove(artifact_path)
-                logging.info(f"Removed artifact: {artifact_path}")
-                deleted_artifacts.append(artifact_path)
-            else:
-                # Log if the file is missing
-                logging.warning(f"Artifact not found (already deleted or moved): {artifact_path}")
-                missing_artifacts.append(artifact_path)
+        # Each line should contain a path to an artifact; commands re-log the same
+        # files on every run, so drop duplicates (keeping log order) and blank lines
+        artifact_paths = dict.fromkeys(line.strip() for line in file)
+    artifact_paths.pop("", None)
+
+    for artifact_path in artifact_paths:
+        try:
+            # Delete the artifact (one unlink instead of an isfile check first)
+            os.remove(artifact_path)
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            # Log if the file is missing
+            logging.warning(f"Artifact not found (already deleted or moved): {artifact_path}")
+            missing_artifacts.append(artifact_path)
+        else:
+            logging.info(f"Removed artifact: {artifact_path}")
+            deleted_artifacts.append(artifact_path)
 
     # Cleanup the artifacts log file after removing files
     os.remove(artifacts_log_path)
@@ -1,19 +1,30 @@
+import numpy as np
 import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
 import os
 import yaml
 import logging
 import click
-import matplotlib.font_manager as fm
 from ml_cli.utils.utils import log_artifact, load_config
 
+# Widest correlation matrix that still gets per-cell value labels in the heatmap
+HEATMAP_ANNOTATE_MAX = 20
+# Default cap on the numeric columns that go into the correlation matrix (--max-corr-cols)
+DEFAULT_MAX_CORR_COLS = 200
+
 
 @click.command(
     help="""Perform exploratory data analysis (EDA) on the dataset specified in the configuration file.
 """
 )
-def eda():
+@click.option(
+    "--max-corr-cols",
+    type=click.IntRange(min=2),
+    default=DEFAULT_MAX_CORR_COLS,
+    show_default=True,
+    help="Maximum number of numeric columns in the correlation matrix; "
+    "wider datasets use a reproducible random sample of columns.",
+)
+def eda(max_corr_cols: int = DEFAULT_MAX_CORR_COLS):
     """Perform exploratory data analysis on the dataset."""
 
     click.secho("Performing EDA ...", fg="green")
@@ -23,14 +34,15 @@ def eda():
         return
 
     # Define artifact file paths
-    summary_file = os.path.join(os.getcwd(), "summary_statistics.csv")
-    eda_report_file = os.path.join(os.getcwd(), "eda_report.csv")
-    correlation_matrix_file = os.path.join(os.getcwd(), "correlation_matrix.png")
+    cwd = os.getcwd()
+    summary_file = os.path.join(cwd, "summary_statistics.csv")
+    eda_report_file = os.path.join(cwd, "eda_report.csv")
+    correlation_matrix_file = os.path.join(cwd, "correlation_matrix.png")
     artifact_files = [summary_file, eda_report_file, correlation_matrix_file]
 
     # Load the dataset
     try:
-        df = pd.read_csv(data_path)
+        df = _read_csv(data_path)
         if df.empty:
             click.secho("The dataset is empty. Nothing to do.", fg="yellow")
             logging.warning("The dataset is empty.")
@@ -58,9 +70,7 @@ def eda():
 
     # Generate summary statistics
     try:
-        summary_statistics = df.describe(include="all").to_dict()
-        summary_df = pd.DataFrame(summary_statistics)
-        summary_df.to_csv(summary_file, index=True)
+        df.describe(include="all").to_csv(summary_file, index=True)
 
         click.secho(f"Summary statistics saved to {summary_file}", fg="green")
         logging.info(f"Summary statistics generated and saved at: {summary_file}")
@@ -79,14 +89,12 @@ def eda():
 
     # Check for missing values and data types
     try:
-        missing_values = df.isnull().sum().to_dict()
-        data_types = df.dtypes.to_dict()
-
+        # Every column comes straight from an array in column order (null counts in one pass)
         eda_df = pd.DataFrame(
             {
-                "Feature": list(df.columns),
-                "Data Type": [str(dtype) for dtype in df.dtypes],
-                "Missing Values": [missing_values[col] for col in df.columns],
+                "Feature": df.columns.to_numpy(),
+                "Data Type": df.dtypes.astype(str).to_numpy(),
+                "Missing Values": df.isnull().sum().to_numpy(),
             }
         )
         eda_df.to_csv(eda_report_file, index=False)
@@ -116,14 +124,15 @@ def eda():
             logging.warning("No numeric columns found for correlation matrix.")
             # Don't return here, as other artifacts might have been generated successfully
         else:
-            correlation_matrix = numeric_df.corr()
-
-            plt.figure(figsize=(10, 8))
-            sns.heatmap(correlation_matrix, annot=True, fmt=".2f", cmap="coolwarm", cbar=True)
-
-            plt.title("Correlation Matrix")
-            plt.savefig(correlation_matrix_file, bbox_inches="tight")
-            plt.close()  # Close the plot to avoid display in interactive environments
+            if numeric_df.shape[1] > max_corr_cols:
+                click.secho(
+                    f"Correlation matrix limited to {max_corr_cols} of {numeric_df.shape[1]} numeric columns "
+                    "(see --max-corr-cols).",
+                    fg="yellow",
+                )
+                numeric_df = _sample_columns(numeric_df, max_corr_cols)
+            correlation_matrix = _correlation_matrix(numeric_df)
+            _save_heatmap(correlation_matrix, correlation_matrix_file)
 
             click.secho(f"Correlation matrix heatmap saved to {correlation_matrix_file}", fg="green")
             logging.info(f"Correlation matrix heatmap generated and saved at: {correlation_matrix_file}")
@@ -141,6 +150,91 @@ def eda():
         return
 
 
+def _read_csv(data_path):
+    """Read the dataset with pyarrow's multithreaded parser, falling back to the default engine.
+
+    The fallback also gives the usual pandas errors (EmptyDataError, ParserError) for bad files.
+    pyarrow parses date and timestamp columns that the default engine leaves as strings; those
+    columns are re-read with the default engine so the report does not depend on the engine.
+    pyarrow also keeps duplicate header names as-is (no ".1" suffixes), so such files are read
+    with the default engine altogether.
+    """
+    try:
+        df = pd.read_csv(data_path, engine="pyarrow")
+    except (ImportError, ValueError):
+        return pd.read_csv(data_path)
+
+    if df.columns.duplicated().any():
+        return pd.read_csv(data_path)
+
+    temporal = [column for column, dtype in df.dtypes.items() if dtype == object or dtype.kind == "M"]
+    if temporal:
+        df[temporal] = pd.read_csv(data_path, usecols=temporal)
+    return df
+
+
+def _sample_columns(numeric_df, n_columns):
+    """Reproducible random subset of n_columns columns, kept in their original order.
+
+    The correlation cost grows with the square of the column count, and a heatmap of
+    hundreds of columns is unreadable anyway.
+    """
+    positions = np.random.default_rng(0).choice(numeric_df.shape[1], size=n_columns, replace=False)
+    return numeric_df.iloc[:, np.sort(positions)]
+
+
+def _correlation_matrix(numeric_df):
+    """Pearson correlation of the numeric columns.
+
+    Without missing values this is one np.corrcoef (BLAS) call, ~10x faster than
+    DataFrame.corr(); with NaNs DataFrame.corr() is kept for its pairwise handling.
+    """
+    values = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+    if np.isnan(values).any():
+        return numeric_df.corr()
+    # Constant columns give NaN like DataFrame.corr(), without the divide warning
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = np.atleast_2d(np.corrcoef(values, rowvar=False))
+    return pd.DataFrame(corr, index=numeric_df.columns, columns=numeric_df.columns)
+
+
+def _save_heatmap(correlation_matrix, file_path):
+    """Save the correlation matrix as an annotated heatmap image.
+
+    Drawn with plain matplotlib: one image for the cells, and value labels only up to
+    HEATMAP_ANNOTATE_MAX columns, since one Text artist per cell dominates the render
+    time (and is unreadable) for wide frames.
+    """
+    # Plotting libraries are slow to import; only load them when a heatmap is drawn
+    import matplotlib
+
+    # The heatmap is only saved to a file, so skip GUI backend detection and setup
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    values = correlation_matrix.to_numpy()
+    labels = [str(col) for col in correlation_matrix.columns]
+    n = len(labels)
+
+    fig, ax = plt.subplots(figsize=(10, 8))
+    image = ax.imshow(values, cmap="coolwarm", vmin=-1, vmax=1, aspect="auto", interpolation="nearest")
+    fig.colorbar(image, ax=ax)
+    ax.set_xticks(range(n), labels, rotation=90)
+    ax.set_yticks(range(n), labels)
+
+    if n <= HEATMAP_ANNOTATE_MAX:
+        for i, j in np.ndindex(n, n):
+            value = values[i, j]
+            if not np.isnan(value):
+                # Light text on the saturated ends of the colormap, dark text elsewhere
+                color = "white" if abs(value) > 0.7 else "black"
+                ax.text(j, i, f"{value:.2f}", ha="center", va="center", color=color)
+
+    ax.set_title("Correlation Matrix")
+    fig.savefig(file_path, bbox_inches="tight")
+    plt.close(fig)  # Close the plot to avoid display in interactive environments
+
+
 def _cleanup_artifacts(artifact_files):
     """Helper function to delete any generated artifacts."""
     for file_path in artifact_files:
@@ -19,6 +19,15 @@ from ml_cli.utils.utils import (
 
 # Constants (UI text only)
 KEYBOARD_INTERRUPT_MESSAGE = "Operation cancelled by user."
+# (text, fg, bold) lines closing the wrap-up guidance; bold=None leaves the style untouched like secho
+AVAILABLE_COMMANDS_LINES = (
+    ("\n📋 Available commands:", "blue", None),
+    ("   ml eda        - Perform exploratory data analysis", "white", None),
+    ("   ml train      - Train your model", "white", None),
+    ("   ml serve      - Serve your model as an API", "white", None),
+    ("   ml predict    - Make predictions", "white", None),
+    ("   ml preprocess - Preprocess your data", "white", None),
+)
 
 
 @click.command(
@@ -178,25 +187,24 @@ def init(format: str, ssl_verify: bool):
         click.secho(f"Configuration file created at: {config_filename}", fg="green")
         logging.info("Configuration file created! (Time taken: %.2fs)", elapsed_time)
 
-        # 14) Friendly wrap-up guidance
+        # 14) Friendly wrap-up guidance, styled line by line and written in one echo
         if changed_directory:
             activate_script_path = os.path.join(target_directory, "activate.sh")
-            click.secho(f"\n✅ Project initialized in: {target_directory}", fg="green", bold=True)
-            click.secho(f"⚠️  Your terminal is still in: {original_dir}", fg="yellow")
-            click.secho("\n💡 To move to your project directory, run:", fg="yellow")
-            click.secho(f"   cd {target_directory}", fg="cyan", bold=True)
-            click.secho("   # OR source the activation script:", fg="blue")
-            click.secho(f"   source {activate_script_path}", fg="cyan")
+            guidance = [
+                (f"\n✅ Project initialized in: {target_directory}", "green", True),
+                (f"⚠️  Your terminal is still in: {original_dir}", "yellow", None),
+                ("\n💡 To move to your project directory, run:", "yellow", None),
+                (f"   cd {target_directory}", "cyan", True),
+                ("   # OR source the activation script:", "blue", None),
+                (f"   source {activate_script_path}", "cyan", None),
+            ]
         else:
-            click.secho("\n✅ Project initialized in current directory!", fg="green", bold=True)
-            click.secho("💡 You can now run commands like 'ml train'.", fg="yellow")
-
-        click.secho("\n📋 Available commands:", fg="blue")
-        click.secho("   ml eda        - Perform exploratory data analysis", fg="white")
-        click.secho("   ml train      - Train your model", fg="white")
-        click.secho("   ml serve      - Serve your model as an API", fg="white")
-        click.secho("   ml predict    - Make predictions", fg="white")
-        click.secho("   ml preprocess - Preprocess your data", fg="white")
+            guidance = [
+                ("\n✅ Project initialized in current directory!", "green", True),
+                ("💡 You can now run commands like 'ml train'.", "yellow", None),
+            ]
+        guidance.extend(AVAILABLE_COMMANDS_LINES)
+        click.echo("\n".join(click.style(text, fg=fg, bold=bold) for text, fg, bold in guidance))
 
         logging.info("Original directory: %s", original_dir)
         logging.info("Target directory: %s", target_directory)
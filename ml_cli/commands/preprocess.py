@@ -4,7 +4,7 @@ import yaml
 import logging
 import click
 import json
-from ml_cli.utils.utils import load_data, encode_categorical_columns, save_preprocessed_data
+from ml_cli.utils.utils import load_data, encode_categorical_columns, save_preprocessed_data, load_yaml_config
 
 
 @click.command(
@@ -32,8 +32,7 @@ def preprocess(config_file: str):
             with open(config_file, "r") as f:
                 config_data = json.load(f)
         else:  # default to YAML
-            with open(config_file, "r") as f:
-                config_data = yaml.safe_load(f)
+            config_data = load_yaml_config(config_file)
     except FileNotFoundError:
         click.secho(f"Error: Configuration file '{config_file}' not found.", fg="red")
         logging.error(f"Configuration file not found: {config_file}")
@@ -3,6 +3,7 @@ import click
 import uvicorn
 import yaml
 import logging
+from ml_cli.utils.utils import load_yaml_config
 
 
 @click.command(
@@ -14,6 +15,7 @@ No need to manually configure features - it's completely flexible!
 Usage example:
   ml serve
   ml serve --port 8080 --no-reload
+  ml serve --no-reload --workers 4
 
 API Endpoints:
   GET  /            - Welcome message and model status
@@ -37,6 +39,25 @@ API Endpoints:
     default=True,
     help="Enable or disable auto-reloading of the server when code changes are detected. Useful for development. (Default: True)",
 )
+@click.option(
+    "--workers",
+    "-w",
+    default=1,
+    type=click.IntRange(min=1),
+    help="The number of worker processes. Each worker loads its own copy of the model. Ignored when --reload is on. (Default: 1)",
+)
+@click.option(
+    "--keep-alive",
+    default=5,
+    type=click.IntRange(min=1),
+    help="Seconds to keep idle HTTP/1.1 connections open. Raise it for clients that reuse connections between predictions. (Default: 5)",
+)
+@click.option(
+    "--limit-concurrency",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Maximum concurrent connections per worker before new requests get HTTP 503. (Default: unlimited)",
+)
 @click.option(
     "--config",
     "-c",
@@ -44,18 +65,19 @@ API Endpoints:
     default="config.yaml",
     help="The absolute or relative path to the configuration file (config.yaml or config.json) used to determine the model output directory.",
 )
-def serve(host: str, port: int, reload: bool, config_file: str):
+def serve(
+    host: str, port: int, reload: bool, workers: int, keep_alive: int, limit_concurrency: int, config_file: str
+):
     """Serve the ML model as a REST API using FastAPI."""
 
     output_dir = "output"
     if os.path.exists(config_file):
-        with open(config_file, "r") as f:
-            try:
-                config = yaml.safe_load(f)
-                output_dir = config.get("output_dir", "output")
-            except yaml.YAMLError as exc:
-                click.secho(f"Error reading config file: {exc}", fg="red")
-                logging.error(f"Error reading config file: {exc}")
+        try:
+            config = load_yaml_config(config_file)
+            output_dir = config.get("output_dir", "output")
+        except yaml.YAMLError as exc:
+            click.secho(f"Error reading config file: {exc}", fg="red")
+            logging.error(f"Error reading config file: {exc}")
 
     # Check if model files exist
     lightautoml_model_path = os.path.join(output_dir, "lightautoml_model.pkl")
@@ -104,4 +126,14 @@ def serve(host: str, port: int, reload: bool, config_file: str):
     click.secho(f"   - Make predictions: POST http://{host}:{port}/predict", fg="blue")
 
     os.environ["ML_CLI_CONFIG"] = config_file
-    uvicorn.run("ml_cli.api.main:app", host=host, port=port, reload=reload)
+    os.environ["ML_CLI_OUTPUT_DIR"] = output_dir  # saves the API from parsing the config again
+    # uvicorn picks uvloop and httptools automatically when they are installed
+    uvicorn.run(
+        "ml_cli.api.main:app",
+        host=host,
+        port=port,
+        reload=reload,
+        workers=None if reload else workers,
+        timeout_keep_alive=keep_alive,
+        limit_concurrency=limit_concurrency,
+    )
@@ -2,10 +2,10 @@ import os
 import logging
 import sys
 import click
-import yaml
 import json
 from ml_cli.core.data import load_data
 from ml_cli.core.train import train_model
+from ml_cli.utils.utils import load_yaml_config
 
 
 @click.command(
@@ -42,8 +42,7 @@ def train(config_file: str):
                 with open(config_file, "r") as f:
                     config = json.load(f)
             else:  # Default to YAML
-                with open(config_file, "r") as f:
-                    config = yaml.safe_load(f)
+                config = load_yaml_config(config_file)
         except Exception as e:
             click.secho(f"Error reading configuration file: {e}", fg="red")
             logging.error(f"Error reading configuration file: {e}")
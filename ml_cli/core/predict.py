@@ -3,10 +3,29 @@ Prediction module for LightAutoML models.
 """
 import os
 import joblib
+import numpy as np
 import pandas as pd
 import logging
 
 
+def _prefetch_file(path: str) -> None:
+    """
+    Ask the kernel to start reading a file into the page cache before unpickling.
+
+    The read-ahead runs in the background, so joblib.load then finds most of
+    the file already cached. No-op on platforms without posix_fadvise.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 def load_lightautoml_model(model_dir: str):
     """
     Load a LightAutoML model from disk.
@@ -21,7 +40,8 @@ def load_lightautoml_model(model_dir: str):
         model_path = os.path.join(model_dir, "lightautoml_model.pkl")
         if not os.path.exists(model_path):
             raise FileNotFoundError(f"Model file not found: {model_path}")
-            
+
+        _prefetch_file(model_path)
         model = joblib.load(model_path)
         logging.info(f"Successfully loaded LightAutoML model from {model_path}")
         return model
@@ -31,17 +51,25 @@ def load_lightautoml_model(model_dir: str):
         raise
 
 
-def make_predictions(model, data: pd.DataFrame, task_type: str = "classification"):
+def make_predictions(
+    model,
+    data: pd.DataFrame,
+    task_type: str = "classification",
+    return_probabilities: bool = True,
+    return_dataframe: bool = True,
+):
     """
     Make predictions using a LightAutoML model.
     
     Args:
         model: Loaded LightAutoML model (or sklearn model for testing)
-        data: DataFrame with features to predict
+        data: DataFrame with features to predict (sklearn models also accept a 2D array)
         task_type: Type of task ("classification" or "regression")
+        return_probabilities: If False, skip building the probability matrix and return None for it
+        return_dataframe: If False, skip building the predictions DataFrame and return None for it
         
     Returns:
-        tuple: (predictions array, predictions DataFrame, probabilities array or None)
+        tuple: (predictions array, predictions DataFrame or None, probabilities array or None)
     """
     try:
         # Make predictions using LightAutoML
@@ -57,7 +85,6 @@ def make_predictions(model, data: pd.DataFrame, task_type: str = "classification
             pred_data = predictions
             
         # Convert to numpy array if needed
-        import numpy as np
         if not isinstance(pred_data, np.ndarray):
             pred_data = np.array(pred_data)
         
@@ -69,7 +96,8 @@ def make_predictions(model, data: pd.DataFrame, task_type: str = "classification
             # LightAutoML returns probabilities for classification
             if len(pred_data.shape) > 1 and pred_data.shape[1] > 1:
                 # Multiclass - pred_data is shape (n_samples, n_classes)
-                probabilities = pred_data  # Store the full probability matrix
+                if return_probabilities:
+                    probabilities = pred_data  # Store the full probability matrix
                 predictions_array = pred_data.argmax(axis=1)  # Get class with highest probability
             else:
                 # Binary classification - pred_data is shape (n_samples,) or (n_samples, 1)
@@ -79,7 +107,8 @@ def make_predictions(model, data: pd.DataFrame, task_type: str = "classification
                 # Check if it looks like probabilities (floats between 0 and 1)
                 if pred_data.dtype in [np.float32, np.float64] and np.all((pred_data >= 0) & (pred_data <= 1)):
                     # Binary classification: pred_data is P(class=1)
-                    probabilities = np.column_stack([1 - pred_data, pred_data])  # [P(class=0), P(class=1)]
+                    if return_probabilities:
+                        probabilities = np.column_stack([1 - pred_data, pred_data])  # [P(class=0), P(class=1)]
                     predictions_array = (pred_data > 0.5).astype(int)  # Convert to class labels
                 else:
                     # Already class labels (unlikely for LightAutoML but handle it)
@@ -89,9 +118,11 @@ def make_predictions(model, data: pd.DataFrame, task_type: str = "classification
             predictions_array = pred_data.ravel()
         
         # Create predictions DataFrame
-        predictions_df = pd.DataFrame({
-            'predictions': predictions_array
-        })
+        predictions_df = None
+        if return_dataframe:
+            predictions_df = pd.DataFrame({
+                'predictions': predictions_array
+            })
         
         logging.info(f"Made {len(predictions_array)} predictions successfully")
         return predictions_array, predictions_df, probabilities
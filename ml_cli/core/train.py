@@ -150,7 +150,7 @@ def train_model(data: pd.DataFrame, config: dict, test_size: float = None):
         test_predictions = automl.predict(test_data)
         
         # Calculate metrics
-        y_test = test_data[target_column].values
+        y_test = test_data[target_column].to_numpy(copy=False)
         
         if task_type == "classification":
             # For classification, predictions might be probabilities
@@ -1,8 +1,12 @@
 import os
+import copy
 import numpy as np
 import sys
 import io
 import json
+import hashlib
+import shutil
+import functools
 import logging
 import difflib
 from pathlib import Path
@@ -14,10 +18,13 @@ import requests
 import questionary
 import click
 from urllib.parse import urlparse
-from fastapi import HTTPException  # FastAPI used indirectly via HTTPException
-from pydantic import create_model
 import joblib
 
+try:
+    from yaml import CSafeLoader as YAMLSafeLoader, CSafeDumper as YAMLSafeDumper  # libyaml C bindings
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YAMLSafeLoader, SafeDumper as YAMLSafeDumper
+
 
 # -----------------------------------------------------------------------------
 # Constants
@@ -34,6 +41,8 @@ KEYBOARD_INTERRUPT_MESSAGE = "Operation cancelled by user."
 LOCAL_DATA_DIR = "data"
 LOCAL_DATA_FILENAME = "data.csv"  # used by download_data()
 DEFAULT_HTTP_TIMEOUT = 12  # seconds
+DOWNLOAD_CHUNK_BYTES = 1024 * 1024  # copy buffer for download_data
+HEADER_CHUNK_BYTES = 64 * 1024  # bytes fetched at a time when only a remote file's header row is needed
 
 # Globals used by load_model
 pipeline = None
@@ -41,6 +50,35 @@ feature_info: Dict[str, Any] | None = None
 PredictionPayload = None
 sample_input_for_docs: Dict[str, Any] | None = None
 
+# Pydantic payload models built by load_model, keyed by a digest of the features they describe
+_payload_model_cache: Dict[bytes, Any] = {}
+# Config path -> ((mtime_ns, size), parsed config) for load_yaml_config
+_yaml_config_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+# Payload field type for the dtype names training writes to feature_info.json
+DTYPE_FIELD_TYPES: Dict[str, type] = {
+    "int8": int,
+    "int16": int,
+    "int32": int,
+    "int64": int,
+    "uint8": int,
+    "uint16": int,
+    "uint32": int,
+    "uint64": int,
+    "float16": float,
+    "float32": float,
+    "float64": float,
+    "object": str,
+    "str": str,
+    "string": str,
+    "category": str,
+    "bool": bool,
+    "boolean": bool,
+}
+
+# Payload field type by numpy/pandas dtype ``kind`` code
+DTYPE_KIND_FIELD_TYPES: Dict[str, type] = {"i": int, "u": int, "f": float, "b": bool, "O": str, "U": str, "S": str}
+
 
 # -----------------------------------------------------------------------------
 # Internal helpers (no public API changes)
@@ -93,6 +131,39 @@ def _response_looks_like_allowed_file(url: str, resp: requests.Response) -> bool
     return ct_ok or cd_ok or ext_ok
 
 
+@functools.lru_cache(maxsize=None)
+def _field_type_for(feature_type: Any) -> type:
+    """Map a feature_info dtype (name or dtype object) to the payload field type.
+
+    Cached: feature sets reuse a handful of dtype names, so each is resolved once per process.
+    """
+    if isinstance(feature_type, str):
+        ft = feature_type.lower()
+        field_type = DTYPE_FIELD_TYPES.get(ft)
+        if field_type is None:
+            field_type = int if "int" in ft else float if "float" in ft or "number" in ft else str
+        return field_type
+
+    # numpy dtypes and pandas extension dtypes both expose a one-letter kind code
+    kind = getattr(feature_type, "kind", None)
+    if kind is None:
+        try:
+            kind = np.dtype(feature_type).kind
+        except TypeError:
+            return float
+    return DTYPE_KIND_FIELD_TYPES.get(kind, str)
+
+
+def numeric_feature_names(feature_info: Dict) -> Tuple[str, ...]:
+    """Names of the features whose payload field type is int or float, in model order."""
+    feature_types = feature_info.get("feature_types", {})
+    return tuple(
+        name
+        for name in feature_info.get("feature_names", [])
+        if (_field_type_for(feature_types[name]) if feature_types.get(name) else float) in (int, float)
+    )
+
+
 def _read_dataframe(data_path: str, ssl_verify: bool = True) -> pd.DataFrame:
     """Read CSV/TXT/JSON from local path or URL, with basic resilience.
     - For .csv/.txt: use pandas' engine='python' with sep=None to sniff.
@@ -129,6 +200,35 @@ def _read_dataframe(data_path: str, ssl_verify: bool = True) -> pd.DataFrame:
             return pd.read_csv(p, engine="python", sep=None, on_bad_lines="skip")
 
 
+def _read_columns(data_path: str, ssl_verify: bool = True) -> pd.Index:
+    """Column names of a CSV/TXT/JSON file (local path or URL) without loading its rows.
+    - For .csv/.txt (and the CSV fallback): only the header row is parsed; for URLs the
+      body is streamed and the download stops once the first line has arrived.
+    - For .json: the file has to be read in full.
+    Raises like _read_dataframe; callers should catch and convert to user messages.
+    """
+    is_url = data_path.startswith(("http://", "https://"))
+    suffix = Path(urlparse(data_path).path if is_url else data_path).suffix.lower()
+
+    if suffix == ".json":
+        return _read_dataframe(data_path, ssl_verify=ssl_verify).columns
+
+    if not is_url:
+        p = Path(data_path).expanduser().resolve()
+        return pd.read_csv(p, engine="python", sep=None, nrows=0).columns
+
+    with requests.get(data_path, verify=ssl_verify, timeout=DEFAULT_HTTP_TIMEOUT, stream=True) as r:
+        r.raise_for_status()
+        head = b""
+        for chunk in r.iter_content(chunk_size=HEADER_CHUNK_BYTES):
+            head += chunk
+            if b"\n" in chunk:
+                break
+        encoding = r.encoding or "utf-8"
+    header = head.split(b"\n", 1)[0].decode(encoding, errors="replace")
+    return pd.read_csv(io.StringIO(header), engine="python", sep=None, nrows=0).columns
+
+
 # -----------------------------------------------------------------------------
 # Public functions (names unchanged)
 # -----------------------------------------------------------------------------
@@ -142,7 +242,7 @@ def write_config(config_data, format, config_filename):
         logging.info(f"Attempting to write configuration to {config_filename} in {format} format.")
         with open(config_filename, "w", encoding="utf-8") as config_file:
             if format == "yaml":
-                yaml.safe_dump(config_data, config_file, sort_keys=False)
+                yaml.dump(config_data, config_file, Dumper=YAMLSafeDumper, sort_keys=False)
             elif format == "json":
                 json.dump(config_data, config_file, indent=4)
             else:
@@ -257,13 +357,14 @@ def is_target_in_file(data_path, target_column, ssl_verify=True):
     """
     logging.info("Checking for target column in data.")
     try:
-        df = _read_dataframe(data_path, ssl_verify=ssl_verify)
+        # Only the header is needed to look for the column
+        columns = _read_columns(data_path, ssl_verify=ssl_verify)
 
-        if target_column in df.columns:
+        if target_column in columns:
             logging.info(f"Target column '{target_column}' found in data.")
             return True, target_column
 
-        suggested_column = suggest_column_name(target_column, df.columns)
+        suggested_column = suggest_column_name(target_column, columns)
         if suggested_column:
             confirm = questionary.confirm(f"Did you mean '{suggested_column}'?").ask()
             if confirm:
@@ -400,10 +501,10 @@ def download_data(data_path, ssl_verify, target_directory):
 
             local_file_path = os.path.join(local_data_path, LOCAL_DATA_FILENAME)
 
-            with open(local_file_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:  # filter out keep-alive chunks
-                        f.write(chunk)
+            # Copy the raw stream in 1 MiB blocks (decoding any gzip/deflate transfer encoding)
+            response.raw.decode_content = True
+            with response, open(local_file_path, "wb") as f:
+                shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_BYTES)
 
             click.secho(f"Data downloaded and saved to {local_file_path}", fg="green")
             return local_file_path
@@ -426,8 +527,9 @@ def generate_realistic_example_from_stats(feature_info: dict) -> dict[str, Any]:
     For categorical features, uses placeholder values that will be replaced by encoders."""
     example: Dict[str, Any] = {}
     
-    # categorical_features is a LIST of categorical feature names (not a dict)
-    categorical_feature_names = feature_info.get("categorical_features", [])
+    # categorical_features is a LIST of categorical feature names (not a dict); a set keeps
+    # the per-feature membership checks below O(1) for wide feature sets
+    categorical_feature_names = frozenset(feature_info.get("categorical_features", []))
 
     # Check if we have feature statistics
     if "feature_statistics" in feature_info:
@@ -472,6 +574,11 @@ def generate_realistic_example_from_stats(feature_info: dict) -> dict[str, Any]:
 
 def load_model(output_dir: str):
     """Load LightAutoML model and return the objects instead of setting globals"""
+    # Only the API loads models; importing FastAPI/pydantic here keeps them (~0.3s)
+    # out of the CLI commands that import this module
+    from fastapi import HTTPException
+    from pydantic import create_model
+
     try:
         model_path = Path(output_dir) / "lightautoml_model.pkl"
         feature_info_path = Path(output_dir) / "feature_info.json"
@@ -486,7 +593,8 @@ def load_model(output_dir: str):
             logging.warning("Model files not found. API will start but predictions will not work.")
             return None, None, None, None
 
-        # Load feature info first to get task type
+        # Load feature info first to get task type. Parsed with the stdlib json module: train writes it
+        # with json.dump, which emits bare NaN (e.g. for a NaN model_score) that orjson rejects.
         with open(feature_info_path, "r", encoding="utf-8") as f:
             feature_info = json.load(f)
 
@@ -501,45 +609,33 @@ def load_model(output_dir: str):
         # Generate realistic example from actual feature statistics
         sample_input_for_docs = generate_realistic_example_from_stats(feature_info)
 
-        # Create the dynamic Pydantic model
-        fields: Dict[str, Tuple[type, Any]] = {}
+        # Create the dynamic Pydantic model (reused across reloads of the same feature set)
         feature_names = feature_info.get("feature_names", [])
         feature_types = feature_info.get("feature_types", {})
+        cache_key = hashlib.blake2b(
+            json.dumps([feature_names, feature_types], sort_keys=True, default=str).encode("utf-8"), digest_size=16
+        ).digest()
 
-        for feature in feature_names:
-            feature_type = feature_types.get(feature)
-            if feature_type:
-                if isinstance(feature_type, str):
-                    ft = feature_type.lower()
-                    if "int" in ft:
-                        fields[feature] = (int, ...)
-                    elif "float" in ft or "number" in ft:
-                        fields[feature] = (float, ...)
-                    else:
-                        fields[feature] = (str, ...)
-                else:
-                    try:
-                        if pd.api.types.is_integer_dtype(feature_type):
-                            fields[feature] = (int, ...)
-                        elif pd.api.types.is_float_dtype(feature_type):
-                            fields[feature] = (float, ...)
-                        else:
-                            fields[feature] = (str, ...)
-                    except Exception:
-                        fields[feature] = (float, ...)
+        PredictionPayload = _payload_model_cache.get(cache_key)
+        if PredictionPayload is not None:
+            logging.info(f"Reusing Pydantic model for {len(feature_names)} unchanged features.")
+        else:
+            fields: Dict[str, Tuple[Any, Any]] = {}
+            for feature in feature_names:
+                feature_type = feature_types.get(feature)
+                # Every key is required, but null is allowed: the model sees it as a missing value (NaN)
+                fields[feature] = (Optional[_field_type_for(feature_type) if feature_type else float], ...)
+
+            logging.info(f"Creating Pydantic model with fields: {list(fields.keys())}")
+            if fields:
+                PredictionPayload = create_model("PredictionPayload", **fields)
+                _payload_model_cache[cache_key] = PredictionPayload
+                logging.info(f"Model loaded successfully with {len(fields)} features.")
             else:
-                fields[feature] = (float, ...)
+                logging.error("No fields created for Pydantic model")
 
-        logging.info(f"Creating Pydantic model with fields: {list(fields.keys())}")
         logging.info(f"Generated example: {sample_input_for_docs}")
 
-        PredictionPayload = None
-        if fields:
-            PredictionPayload = create_model("PredictionPayload", **fields)
-            logging.info(f"Model loaded successfully with {len(fields)} features.")
-        else:
-            logging.error("No fields created for Pydantic model")
-
         return pipeline, feature_info, PredictionPayload, sample_input_for_docs
 
     except FileNotFoundError:
@@ -549,17 +645,34 @@ def load_model(output_dir: str):
         raise HTTPException(status_code=500, detail=f"Error loading model: {e}")
 
 
+def load_yaml_config(config_path: str) -> Dict[str, Any]:
+    """Parse a YAML config file using the libyaml-backed safe loader when available.
+    Returns an empty dict for an empty file; raises on I/O or YAML errors.
+
+    The parsed config is cached per file and re-parsed only when its mtime or size
+    changes; callers get their own copy, so mutating it does not touch the cache.
+    """
+    with open(config_path, "r", encoding="utf-8") as f:
+        st = os.fstat(f.fileno())
+        path = os.path.abspath(config_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _yaml_config_cache.get(path)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, yaml.load(f, Loader=YAMLSafeLoader) or {})
+            _yaml_config_cache[path] = cached
+    return copy.deepcopy(cached[1])
+
+
 def get_config_output_dir(config_path: str = "config.yaml") -> str:
-    """Get output directory from config file"""
-    output_dir = "output"
-    if os.path.exists(config_path):
-        try:
-            with open(config_path, "r") as f:
-                config = yaml.safe_load(f)
-                output_dir = config.get("output_dir", "output")
-        except yaml.YAMLError as exc:
-            logging.error(f"Error loading config file: {exc}")
-    return output_dir
+    """Get output directory from config file (load_yaml_config re-parses it only when it changes)"""
+    try:
+        config = load_yaml_config(config_path)
+    except OSError:
+        return "output"
+    except yaml.YAMLError as exc:
+        logging.error(f"Error loading config file: {exc}")
+        return "output"
+    return config.get("output_dir", "output")
 
 
 def load_data(data_path):
@@ -614,8 +727,7 @@ def encode_categorical_columns(df):
 def load_config(config_file="config.yaml"):
     """Load configuration file to get the data path."""
     try:
-        with open(config_file, "r", encoding="utf-8") as f:
-            config_data = yaml.safe_load(f) or {}
+        config_data = load_yaml_config(config_file)
         data_path = config_data["data"]["data_path"]
         return data_path
     except FileNotFoundError:
@@ -872,48 +984,84 @@ def safe_array_check(arr):
         return False
 
 
-def format_prediction_response(prediction, feature_info, probabilities=None):
+def format_prediction_response(prediction, feature_info, probabilities=None, task_type=None):
     """Format prediction response based on task type.
     
     Note: prediction should already be class labels (not probabilities) for classification.
     The make_predictions() function in core/predict.py handles this conversion.
+
+    Callers that resolved the lower-cased task type once (like the API at model load)
+    can pass it as task_type instead of having it looked up on every call.
+    The response is format_batch_prediction_response()'s for a one-row batch.
     """
-    task_type = feature_info.get("task_type", "unknown").lower()
+    # Safely get prediction value (the first one when given an array)
+    rows = np.asarray(prediction).reshape(-1)[:1] if safe_array_check(prediction) else [None]
+    if probabilities is not None and safe_array_check(probabilities):
+        probabilities = np.asarray(probabilities).reshape(1, -1)
+    else:
+        probabilities = None
+    return format_batch_prediction_response(rows, feature_info, probabilities, task_type=task_type)[0]
 
-    # Safely get prediction value
-    prediction_value = None
-    if safe_array_check(prediction):
-        try:
-            prediction_value = convert_numpy_types(prediction[0])
-        except (IndexError, TypeError):
-            prediction_value = convert_numpy_types(prediction)
 
-    result = {
-        "prediction": prediction_value,
-        "task_type": task_type,
-    }
+def _to_native_list(values):
+    """Array-like -> (nested) list of Python scalars, NaN as None like convert_numpy_types().
+
+    Numeric arrays without NaN go through a single C-level ndarray.tolist().
+    """
+    arr = np.asarray(values)
+    if arr.dtype.kind in "biu":
+        return arr.tolist()
+    if arr.dtype.kind == "f":
+        missing = np.isnan(arr)
+        if not missing.any():
+            return arr.tolist()
+        # convert_numpy_types() would turn a whole one-element array holding NaN into None
+        arr = arr.astype(object)
+        arr[missing] = None
+        return arr.tolist()
+    return [convert_numpy_types(x) for x in arr.tolist()]
+
+
+def format_batch_prediction_response(predictions, feature_info, probabilities=None, task_type=None):
+    """Format a whole batch of predictions at once.
+
+    Returns one dict per row with the same keys format_prediction_response()
+    gives a single prediction; the arrays are converted to native types once
+    instead of row by row. task_type works as in format_prediction_response().
+    """
+    if task_type is None:
+        task_type = feature_info.get("task_type", "unknown").lower()
+    values = _to_native_list(predictions)
 
-    # Add task-specific information
     if task_type == "classification":
-        # prediction_value should already be a class label (0, 1, 2, etc.)
-        result["predicted_class"] = prediction_value
-        
-        # Add probability information if available
-        if probabilities is not None and safe_array_check(probabilities):
-            prob_list = convert_numpy_types(probabilities)
-            result["probabilities"] = prob_list
-            result["confidence"] = float(max(prob_list)) if isinstance(prob_list, list) and prob_list else None
-
-    elif task_type == "regression":
-        # For regression, the prediction is the actual value
-        result["predicted_value"] = prediction_value
-
-    elif task_type == "clustering":
-        # For clustering, prediction is the cluster ID
-        result["cluster_id"] = prediction_value
-        result["cluster"] = f"Cluster_{prediction_value}" if prediction_value is not None else "Unknown"
-
-    # Convert entire result dict to ensure all numpy types are converted
-    result = convert_numpy_types(result)
-    
-    return result
+        if probabilities is None or not safe_array_check(probabilities):
+            return [{"prediction": v, "task_type": task_type, "predicted_class": v} for v in values]
+        probabilities = np.asarray(probabilities, dtype=np.float64)
+        prob_rows = _to_native_list(probabilities)
+        confidences = _to_native_list(probabilities.max(axis=1))  # every row's max in one pass
+        return [
+            {
+                "prediction": v,
+                "task_type": task_type,
+                "predicted_class": v,
+                "probabilities": p,
+                "confidence": c,
+            }
+            for v, p, c in zip(values, prob_rows, confidences)
+        ]
+
+    if task_type == "regression":
+        return [{"prediction": v, "task_type": task_type, "predicted_value": v} for v in values]
+
+    if task_type == "clustering":
+        return [
+            {
+                "prediction": v,
+                "task_type": task_type,
+                "cluster_id": v,
+                "cluster": f"Cluster_{v}" if v is not None else "Unknown",
+            }
+            for v in values
+        ]
+
+    return [{"prediction": v, "task_type": task_type} for v in values]
@@ -43,7 +43,7 @@ setup(
         "pytest>=7.0.0,<9.0.0",
         "psutil>=5.8.0",
         "fastapi>=0.100.0,<1.0.0",
-        "uvicorn>=0.20.0,<1.0.0",
+        "uvicorn[standard]>=0.20.0,<1.0.0",
         "scikit-learn>=1.1.0,<2.0.0",
         "joblib>=1.1.0,<2.0.0",
         "lightautoml",
@@ -60,8 +60,10 @@ setup(
         "psycopg2-binary>=2.9.0,<3.0.0",
         "alembic>=1.7.0,<2.0.0",
         "greenlet>=1.1.0,<4.0.0",
+        "pydantic>=2.0.0,<3.0.0",
         "pydantic-settings>=2.0.0,<3.0.0",
         "certifi>=2021.0.0",
+        "orjson>=3.8.0,<4.0.0",
         "pyarrow",
     ],
     entry_points={
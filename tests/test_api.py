@@ -0,0 +1,349 @@
+import os
+import json
+import logging
+import tempfile
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor
+import joblib
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.linear_model import LogisticRegression
+from ml_cli.api import main
+
+
+@pytest.fixture
+def client(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        output_dir = os.path.join(tmpdir, "output")
+        os.makedirs(output_dir, exist_ok=True)
+
+        # Dummy fitted pipeline standing in for the LightAutoML model
+        pipeline = Pipeline([("scaler", StandardScaler()), ("logreg", LogisticRegression())])
+        X_dummy = np.array([[1, 2], [3, 4], [5, 6], [7, 8]])
+        y_dummy = np.array([0, 1, 0, 1])
+        pipeline.fit(X_dummy, y_dummy)
+        joblib.dump(pipeline, os.path.join(output_dir, "lightautoml_model.pkl"))
+
+        feature_info = {
+            "feature_names": ["feature1", "feature2"],
+            "feature_types": {"feature1": "int64", "feature2": "float64"},
+            "task_type": "classification",
+        }
+        with open(os.path.join(output_dir, "feature_info.json"), "w") as f:
+            json.dump(feature_info, f)
+
+        config_file = os.path.join(tmpdir, "config.yaml")
+        with open(config_file, "w") as f:
+            f.write(f"output_dir: {output_dir}")
+        monkeypatch.setenv("ML_CLI_CONFIG", config_file)
+
+        with TestClient(main.app) as test_client:
+            # Let the background startup load finish before tests touch the model state
+            main.app.state.model_future.result()
+            yield test_client
+
+        # Module globals outlive the app; force a clean load for the next test
+        main._state = None
+
+
+def test_predict(client):
+    response = client.post("/predict", json={"feature1": 1, "feature2": 2})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["task_type"] == "classification"
+    assert data["prediction"] in [0, 1]
+
+
+def test_predict_invalid_json(client):
+    response = client.post("/predict", content=b"{not json", headers={"content-type": "application/json"})
+    assert response.status_code == 422
+
+
+def test_predict_missing_feature(client):
+    response = client.post("/predict", json={"feature1": 1})
+    assert response.status_code == 400
+
+
+def test_predict_invalid_feature_type(client):
+    response = client.post("/predict", json={"feature1": "abc", "feature2": 2})
+    assert response.status_code == 400
+    assert response.json()["detail"][0]["loc"] == ["feature1"]
+
+
+class _RecordingModel:
+    """Regression stand-in that keeps the inputs it was asked to predict."""
+
+    def __init__(self):
+        self.inputs = []
+
+    def predict(self, data):
+        self.inputs.append(data)
+        return np.zeros(len(data))
+
+
+def test_predict_null_feature(client, monkeypatch):
+    model = _RecordingModel()
+    state = dataclasses.replace(main._state, pipeline=model, task_type="regression")
+    monkeypatch.setattr(main, "_state", state)
+
+    response = client.post("/predict", json={"feature1": 1, "feature2": None})
+    assert response.status_code == 200
+    assert response.json()["input_features"] == {"feature1": 1, "feature2": None}
+
+    samples = [{"feature1": None, "feature2": 2}, {"feature1": None, "feature2": None}]
+    assert client.post("/predict/batch", json={"samples": samples}).status_code == 200
+    assert np.isnan(np.asarray(model.inputs[0], dtype=np.float64)[0, 1])
+    assert np.isnan(np.asarray(model.inputs[1], dtype=np.float64)).sum() == 3
+
+
+def test_model_loads_with_nan_model_score(client):
+    output_dir = main.get_config_output_dir(os.environ["ML_CLI_CONFIG"])
+    info_path = os.path.join(output_dir, "feature_info.json")
+    with open(info_path) as f:
+        feature_info = json.load(f)
+    feature_info["model_score"] = float("nan")  # json.dump writes a bare NaN, as train does
+    with open(info_path, "w") as f:
+        json.dump(feature_info, f)
+
+    assert client.post("/reload-model", params={"force": True}).status_code == 200
+    assert client.get("/model-info").json()["model_score"] is None
+    assert client.post("/predict", json={"feature1": 1, "feature2": 2}).status_code == 200
+
+
+def test_predict_bool_feature(client):
+    output_dir = main.get_config_output_dir(os.environ["ML_CLI_CONFIG"])
+    info_path = os.path.join(output_dir, "feature_info.json")
+    with open(info_path) as f:
+        feature_info = json.load(f)
+    feature_info["feature_types"]["feature1"] = "bool"
+    with open(info_path, "w") as f:
+        json.dump(feature_info, f)
+    assert client.post("/reload-model").status_code == 200
+
+    response = client.post("/predict", json={"feature1": True, "feature2": 2})
+    assert response.status_code == 200
+    samples = [{"feature1": True, "feature2": 2}, {"feature1": False, "feature2": 8}]
+    assert client.post("/predict/batch", json={"samples": samples}).status_code == 200
+
+    response = client.post("/predict/batch", json={"samples": [{"feature1": "maybe", "feature2": 2}]})
+    assert response.status_code == 400
+    assert response.json()["detail"][0]["loc"] == [0, "feature1"]
+
+
+class _ProbabilityModel:
+    """Mimics LightAutoML: predict() returns P(class=1) for binary classification."""
+
+    def predict(self, data):
+        return np.full(len(data), 0.8)
+
+
+def test_predict_include_proba(client, monkeypatch):
+    state = dataclasses.replace(main._state, pipeline=_ProbabilityModel(), use_ndarray=False)
+    monkeypatch.setattr(main, "_state", state)
+
+    data = client.post("/predict", json={"feature1": 1, "feature2": 2}).json()
+    assert data["probabilities"] == [pytest.approx(0.2), 0.8]
+
+    data = client.post("/predict", params={"include_proba": False}, json={"feature1": 1, "feature2": 2}).json()
+    assert data["prediction"] == 1
+    assert "probabilities" not in data
+
+
+def test_predict_batch(client):
+    samples = [{"feature1": 1, "feature2": 2}, {"feature1": 7, "feature2": 8}]
+    response = client.post("/predict/batch", json={"samples": samples})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_samples"] == 2
+    assert [p["sample_index"] for p in data["predictions"]] == [0, 1]
+
+
+def test_predict_batch_stream(client, monkeypatch):
+    monkeypatch.setattr(main, "STREAM_CHUNK_ROWS", 2)
+    samples = [{"feature1": i, "feature2": i + 1} for i in range(5)]
+
+    response = client.post("/predict/batch", params={"stream": True}, json={"samples": samples})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    streamed = [json.loads(line) for line in response.text.splitlines()]
+
+    expected = client.post("/predict/batch", json={"samples": samples}).json()["predictions"]
+    assert streamed == expected
+
+
+def test_predict_batch_numeric_strings(client):
+    samples = [{"feature1": "1", "feature2": "2.5"}, {"feature1": 7, "feature2": 8}]
+    response = client.post("/predict/batch", json={"samples": samples})
+    assert response.status_code == 200
+
+    samples[0]["feature2"] = "abc"
+    response = client.post("/predict/batch", json={"samples": samples})
+    assert response.status_code == 400
+
+
+def test_predict_batch_probabilities(client, monkeypatch):
+    monkeypatch.setattr(main, "_state", dataclasses.replace(main._state, pipeline=_ProbabilityModel()))
+    samples = [{"feature1": 1, "feature2": 2}, {"feature1": 7, "feature2": 8}]
+    data = client.post("/predict/batch", json={"samples": samples}).json()
+
+    single = client.post("/predict", json=samples[0]).json()
+    assert data["predictions"][0] == {**single, "sample_index": 0}
+    assert data["predictions"][1]["confidence"] == 0.8
+
+
+def test_format_prediction_response_matches_batch_row():
+    info = {"task_type": "classification"}
+    probabilities = np.array([[np.nan, 0.7]])
+
+    single = main.format_prediction_response(np.array([1]), info, probabilities[0])
+    assert single == main.format_batch_prediction_response(np.array([1]), info, probabilities)[0]
+    assert single["probabilities"] == [None, 0.7]
+    assert single["confidence"] is None
+
+
+def test_model_info_and_examples(client):
+    info = client.get("/model-info").json()
+    assert info["feature_names"] == ["feature1", "feature2"]
+    assert info["model_type"] == "classification"
+
+    example = client.get("/predict/example").json()
+    assert example == main._state.sample_input
+    assert client.get("/predict/batch").json() == {"examples": [example, example]}
+
+
+def test_reload_model_skips_unchanged_artifacts(client):
+    response = client.post("/reload-model")
+    assert response.status_code == 200
+    assert response.json()["status"] == "unchanged"
+    assert response.json()["example_updated"] is False
+
+    response = client.post("/reload-model", params={"force": True})
+    assert response.status_code == 200
+    assert response.json()["status"] == "reloaded"
+
+
+def test_reload_model_failure_keeps_previous_model(client):
+    output_dir = main.get_config_output_dir(os.environ["ML_CLI_CONFIG"])
+    with open(os.path.join(output_dir, "lightautoml_model.pkl"), "wb") as f:
+        f.write(b"not a pickle")
+
+    response = client.post("/reload-model", params={"force": True})
+    assert response.status_code == 500
+    assert client.post("/predict", json={"feature1": 1, "feature2": 2}).status_code == 200
+
+
+def test_startup_without_model_only_warns(monkeypatch, caplog, tmp_path):
+    monkeypatch.setenv("ML_CLI_OUTPUT_DIR", str(tmp_path))
+    main._state = None
+    with TestClient(main.app) as test_client:
+        main.app.state.model_future.result()
+        assert test_client.post("/predict", json={"feature1": 1, "feature2": 2}).status_code == 503
+
+    assert "No trained model found!" in caplog.text
+    assert not [record for record in caplog.records if record.levelno >= logging.ERROR]
+
+
+def test_predict_micro_batching(client):
+    main._batcher = main._MicroBatcher(0.005)
+    try:
+        payloads = [{"feature1": i, "feature2": i + 1} for i in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            responses = list(executor.map(lambda p: client.post("/predict", json=p), payloads))
+    finally:
+        main._batcher.stop()
+        main._batcher = None
+
+    assert all(r.status_code == 200 for r in responses)
+    assert [r.json()["input_features"] for r in responses] == payloads
+
+
+class _RejectsNegativeModel:
+    """predict() fails for any batch containing a negative feature1."""
+
+    def predict(self, data):
+        if (np.asarray(data)[:, 0] < 0).any():
+            raise ValueError("negative feature1")
+        return np.zeros(len(data))
+
+
+def test_micro_batcher_falls_back_to_single_predictions(client):
+    state = dataclasses.replace(main._state, pipeline=_RejectsNegativeModel(), task_type="regression")
+    batcher = main._MicroBatcher(1.0)
+    try:
+        good = batcher.submit(state, np.array([[1.0, 2.0]]))
+        bad = batcher.submit(state, np.array([[-1.0, 2.0]]))
+        assert good.result(timeout=5)[0].tolist() == [0.0]
+        with pytest.raises(ValueError):
+            bad.result(timeout=5)
+    finally:
+        batcher.stop()
+    assert not batcher._thread.is_alive()
+
+
+def test_openapi_schema_uses_loaded_example(client):
+    response = client.get("/openapi.json")
+    assert response.status_code == 200
+    request_body = response.json()["paths"]["/predict"]["post"]["requestBody"]
+    assert request_body["content"]["application/json"]["example"] == main._state.sample_input
+
+
+def test_predict_in_worker_process(client, monkeypatch):
+    monkeypatch.setenv("ML_CLI_PREDICT_PROCESSES", "1")
+    assert client.post("/reload-model", params={"force": True}).status_code == 200
+    assert main._state.predict_pool is not None
+
+    response = client.post("/predict", json={"feature1": 1, "feature2": 2})
+    assert response.status_code == 200
+    assert response.json()["prediction"] in [0, 1]
+
+
+def test_reload_model_uses_output_dir_env(client, monkeypatch):
+    output_dir = main.get_config_output_dir(os.environ["ML_CLI_CONFIG"])
+    monkeypatch.setenv("ML_CLI_CONFIG", "missing-config.yaml")
+    monkeypatch.setenv("ML_CLI_OUTPUT_DIR", output_dir)
+
+    response = client.post("/reload-model", params={"force": True})
+    assert response.status_code == 200
+    assert response.json()["status"] == "reloaded"
+
+
+def test_apply_categorical_encoding_matches_label_encoder():
+    from sklearn.preprocessing import LabelEncoder
+
+    encoder = LabelEncoder().fit(["red", "green", "blue"])
+    encoder_maps = {"color": {cls: code for code, cls in enumerate(encoder.classes_.tolist())}}
+
+    encoded = main.apply_categorical_encoding({"color": "red", "size": 3}, encoder_maps)
+    assert encoded == {"color": int(encoder.transform(["red"])[0]), "size": 3}
+
+    with pytest.raises(main.HTTPException) as exc_info:
+        main.apply_categorical_encoding({"color": "purple"}, encoder_maps)
+    assert exc_info.value.status_code == 400
+
+
+def test_predict_batch_categorical_encoding(client, monkeypatch):
+    encoder_maps = {"feature1": {"blue": 0, "red": 1}}
+    monkeypatch.setattr(main, "_state", dataclasses.replace(main._state, encoder_maps=encoder_maps))
+    samples = [{"feature1": "red", "feature2": 2}, {"feature1": "blue", "feature2": 8}]
+    response = client.post("/predict/batch", json={"samples": samples})
+    assert response.status_code == 200
+    assert response.json()["total_samples"] == 2
+
+    samples.append({"feature1": "purple", "feature2": 1})
+    response = client.post("/predict/batch", json={"samples": samples})
+    assert response.status_code == 400
+    assert "samples [2]" in response.json()["detail"]
+
+
+def test_predict_echoes_raw_categorical_values(client, monkeypatch):
+    encoder_maps = {"feature1": {"blue": 0, "red": 1}}
+    monkeypatch.setattr(main, "_state", dataclasses.replace(main._state, encoder_maps=encoder_maps))
+    sample = {"feature1": "red", "feature2": "2.5"}
+
+    single = client.post("/predict", json=sample).json()
+    batch = client.post("/predict/batch", json={"samples": [sample]}).json()
+    assert single["input_features"] == sample
+    assert batch["predictions"][0]["input_features"] == sample
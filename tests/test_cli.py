@@ -1,6 +1,8 @@
 import os
 from click.testing import CliRunner
 from ml_cli.cli import cli
+from ml_cli.commands.eda import _read_csv, _correlation_matrix
+from ml_cli.utils.utils import _read_columns
 import pandas as pd
 import multiprocessing
 import time
@@ -12,7 +14,7 @@ import tempfile
 import joblib
 import json
 import numpy as np
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 import pytest
 
 
@@ -168,6 +170,75 @@ def test_eda_command():
             assert os.path.exists("correlation_matrix.png")
 
 
+def test_eda_command_limits_correlation_columns():
+    runner = CliRunner()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with runner.isolated_filesystem(temp_dir=tmpdir):
+            with open("config.yaml", "w") as f:
+                f.write("data:\n  data_path: data.csv")
+
+            rng = np.random.default_rng(0)
+            data = pd.DataFrame(rng.normal(size=(20, 6)), columns=[f"feature{i}" for i in range(6)])
+            data.to_csv("data.csv", index=False)
+
+            result = runner.invoke(cli, ["eda", "--max-corr-cols", "3"])
+            assert result.exit_code == 0
+            assert "Correlation matrix limited to 3 of 6 numeric columns" in result.output
+            assert os.path.exists("correlation_matrix.png")
+
+
+def test_correlation_matrix_matches_dataframe_corr():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(50, 4)), columns=list("abcd"))
+    df["constant"] = 1.0
+    pd.testing.assert_frame_equal(_correlation_matrix(df), df.corr())
+
+    df.iloc[[3, 7], 1] = np.nan
+    df.iloc[11, 2] = np.nan
+    pd.testing.assert_frame_equal(_correlation_matrix(df), df.corr())
+
+
+def test_eda_read_csv_matches_default_engine_dtypes():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_path = os.path.join(tmpdir, "data.csv")
+        with open(data_path, "w") as f:
+            f.write("id,name,day,stamp,score\n1,a,2024-01-01,2024-01-01 10:00:00,0.5\n2,b,,2024-01-02T11:00:00,\n")
+        # pyarrow keeps repeated header names; the default engine suffixes them (a, a.1)
+        duplicates_path = os.path.join(tmpdir, "duplicates.csv")
+        with open(duplicates_path, "w") as f:
+            f.write("a,a,b\n1,2024-01-01,x\n3,2024-01-02,y\n")
+
+        for path in (data_path, duplicates_path):
+            df = _read_csv(path)
+            expected = pd.read_csv(path)
+            assert df.dtypes.astype(str).tolist() == expected.dtypes.astype(str).tolist()
+            pd.testing.assert_frame_equal(df, expected)
+
+
+def test_read_columns_streams_only_the_header():
+    chunks = iter([b"sepal_len", b"gth,spec", b"ies\n5.1,setosa\n", b"4.9,setosa\n"])
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.iter_content.return_value = chunks
+    response.encoding = None
+
+    with patch("ml_cli.utils.utils.requests.get", return_value=response) as mock_get:
+        columns = _read_columns("https://example.com/data.csv")
+
+    assert columns.tolist() == ["sepal_length", "species"]
+    assert mock_get.call_args.kwargs["stream"] is True
+    assert next(chunks) == b"4.9,setosa\n"  # the rest of the body was never downloaded
+
+
+def test_read_columns_sniffs_local_separator():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_path = os.path.join(tmpdir, "data.csv")
+        with open(data_path, "w") as f:
+            f.write("feature1;feature2;target\n1;2;0\n3;4;1\n")
+
+        assert _read_columns(data_path).tolist() == ["feature1", "feature2", "target"]
+
+
 def test_preprocess_command():
     runner = CliRunner()
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -199,3 +270,18 @@ def test_clean_command():
             assert result.exit_code == 0
             assert not os.path.exists("artifact.txt")
             assert not os.path.exists(".artifacts.log")
+
+
+def test_clean_command_deduplicates_log():
+    runner = CliRunner()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with runner.isolated_filesystem(temp_dir=tmpdir):
+            with open("artifact.txt", "w") as f:
+                f.write("dummy artifact")
+            with open(".artifacts.log", "w") as f:
+                f.write("artifact.txt\nartifact.txt\n\ngone.txt\n")
+
+            result = runner.invoke(cli, ["clean"])
+            assert result.exit_code == 0
+            assert "Total artifacts deleted: 1" in result.output
+            assert "Total artifacts missing: 1" in result.output